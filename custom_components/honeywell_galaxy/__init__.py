@@ -3,12 +3,13 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 
 from .const import DOMAIN
 from .coordinator import GalaxyCoordinator
@@ -43,10 +44,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    _async_schedule_card_retries(hass, entry)
     entry.async_on_unload(_async_listen_for_device_area_changes(hass, entry))
 
-    hass.async_create_task(auto_add_cards(hass, entry))
+    async def _add_cards_then_retry() -> None:
+        await auto_add_cards(hass, entry)
+        if entry.state is ConfigEntryState.LOADED:
+            _async_schedule_card_retries(hass, entry)
+
+    @callback
+    def _add_cards_after_start(_hass: HomeAssistant) -> None:
+        hass.async_create_task(_add_cards_then_retry())
+
+    # Keep dashboard writes, and the area sync retries, off the startup
+    # critical path; the retries start once the first pass has finished
+    entry.async_on_unload(async_at_started(hass, _add_cards_after_start))
 
     return True
 
@@ -57,7 +68,7 @@ def _async_schedule_card_retries(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
     @callback
     def _retry_cards(_now) -> None:
-        hass.async_create_task(auto_add_cards(hass, entry, delay_seconds=0))
+        hass.async_create_task(auto_add_cards(hass, entry, wait_seconds=0))
 
     for delay in AREA_SYNC_DELAYS:
         entry.async_on_unload(async_call_later(hass, delay, _retry_cards))
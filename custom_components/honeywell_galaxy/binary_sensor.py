@@ -11,22 +11,42 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
+    ON_PAYLOADS,
+    OPEN_PAYLOADS,
     TOPIC_PRIO_INPUTS,
     TOPIC_PRIO_OUTPUTS,
     TOPIC_VRIO_OUTPUTS,
 )
 from .coordinator import GalaxyCoordinator
 from .device import physical_rio_device_info, virtual_rio_device_info
-from .mqtt_discovery import discover_mqtt_numeric_ids
+from .mqtt_discovery import discover_cached_numeric_ids
 
 _LOGGER = logging.getLogger(__name__)
 
+_EMPTY: tuple = ()
+
+# (options key, topic template, discovery label) for auto-discovered entities.
+DISCOVERY_SOURCES = (
+    ("physical_rio_zones", TOPIC_PRIO_INPUTS, "Physical RIO zone"),
+    ("physical_rio_outputs", TOPIC_PRIO_OUTPUTS, "Physical RIO output"),
+    ("virtual_rio_outputs", TOPIC_VRIO_OUTPUTS, "Virtual RIO output"),
+)
+
+ZONE_TYPE_DEVICE_CLASSES = {
+    "movement": BinarySensorDeviceClass.MOTION,
+    "motion": BinarySensorDeviceClass.MOTION,
+    "pir": BinarySensorDeviceClass.MOTION,
+    "panic": BinarySensorDeviceClass.SMOKE,
+    "smoke": BinarySensorDeviceClass.SMOKE,
+    "alarm": BinarySensorDeviceClass.SMOKE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,44 +57,30 @@ async def async_setup_entry(
     coordinator: GalaxyCoordinator = hass.data[DOMAIN][entry.entry_id]
     vmodid = entry.data.get("vmodid", "")
 
-    entities = []
+    physical_zones = entry.options.get("physical_rio_zones", _EMPTY)
+    physical_outputs = entry.options.get("physical_rio_outputs", _EMPTY)
+    virtual_outputs = entry.options.get("virtual_rio_outputs", _EMPTY)
 
-    physical_zones = entry.options.get("physical_rio_zones", [])
-    physical_outputs = entry.options.get("physical_rio_outputs", [])
-    virtual_outputs = entry.options.get("virtual_rio_outputs", [])
+    topic_prefixes = {
+        option_key: topic_template.format(vmodid=vmodid)
+        for option_key, topic_template, _label in DISCOVERY_SOURCES
+    }
+    prio_inputs_topic = topic_prefixes["physical_rio_zones"]
+    prio_outputs_topic = topic_prefixes["physical_rio_outputs"]
+    vrio_outputs_topic = topic_prefixes["virtual_rio_outputs"]
 
     discovery_tasks: dict[str, asyncio.Task[set[int]]] = {}
-    if not physical_zones:
-        _LOGGER.info(
-            "No Physical RIO zones configured. Discovering zones from MQTT topics..."
-        )
-        discovery_tasks["prio_zones"] = asyncio.create_task(
-            discover_mqtt_numeric_ids(
-                coordinator,
-                f"{TOPIC_PRIO_INPUTS.format(vmodid=vmodid)}/+",
-                label="Physical RIO zone",
-            )
-        )
-    if not physical_outputs:
-        _LOGGER.info(
-            "No Physical RIO outputs configured. Discovering outputs from MQTT topics..."
-        )
-        discovery_tasks["prio_outputs"] = asyncio.create_task(
-            discover_mqtt_numeric_ids(
+    for option_key, _topic_template, label in DISCOVERY_SOURCES:
+        if entry.options.get(option_key):
+            continue
+        _LOGGER.info("No %ss configured. Discovering from MQTT topics...", label)
+        discovery_tasks[option_key] = asyncio.create_task(
+            discover_cached_numeric_ids(
                 coordinator,
-                f"{TOPIC_PRIO_OUTPUTS.format(vmodid=vmodid)}/+",
-                label="Physical RIO output",
-            )
-        )
-    if not virtual_outputs:
-        _LOGGER.info(
-            "No Virtual RIO outputs configured. Discovering outputs from MQTT topics..."
-        )
-        discovery_tasks["vrio_outputs"] = asyncio.create_task(
-            discover_mqtt_numeric_ids(
-                coordinator,
-                f"{TOPIC_VRIO_OUTPUTS.format(vmodid=vmodid)}/+",
-                label="Virtual RIO output",
+                entry,
+                option_key,
+                f"{topic_prefixes[option_key]}/+",
+                label=label,
             )
         )
 
@@ -84,101 +90,67 @@ async def async_setup_entry(
         results = await asyncio.gather(*discovery_tasks.values())
         discovered = dict(zip(names, results, strict=True))
 
+    entities: list[PhysicalRIOZone | PhysicalRIOOutput | VirtualRIOOutput]
     if not physical_zones:
-        discovered_zones = discovered.get("prio_zones", set())
-        _LOGGER.info(
-            "Discovered %s Physical RIO zones: %s",
-            len(discovered_zones),
-            sorted(discovered_zones),
-        )
-        for zone_num in discovered_zones:
-            entities.append(
-                PhysicalRIOZone(
-                    coordinator,
-                    entry,
-                    vmodid,
-                    zone_num,
-                    None,
-                    BinarySensorDeviceClass.DOOR,
-                )
-            )
+        discovered_zones = discovered.get("physical_rio_zones", set())
+        _LOGGER.info("Discovered %s Physical RIO zones", len(discovered_zones))
+        entities = [
+            PhysicalRIOZone(coordinator, entry, prio_inputs_topic, zone_num)
+            for zone_num in discovered_zones
+        ]
     else:
-        for zone_config in physical_zones:
-            zone_type = zone_config.get("zone_type", "contact")
-            device_class = BinarySensorDeviceClass.DOOR
-            if zone_type in ["movement", "motion", "pir"]:
-                device_class = BinarySensorDeviceClass.MOTION
-            elif zone_type in ["panic", "smoke", "alarm"]:
-                device_class = BinarySensorDeviceClass.SMOKE
-
-            entities.append(
-                PhysicalRIOZone(
-                    coordinator,
-                    entry,
-                    vmodid,
-                    zone_config.get("zone_number"),
-                    zone_config.get("name"),
-                    device_class,
-                )
+        entities = [
+            PhysicalRIOZone(
+                coordinator,
+                entry,
+                prio_inputs_topic,
+                zone_config.get("zone_number"),
+                zone_config.get("name"),
+                ZONE_TYPE_DEVICE_CLASSES.get(
+                    zone_config.get("zone_type", "contact"),
+                    BinarySensorDeviceClass.DOOR,
+                ),
             )
+            for zone_config in physical_zones
+        ]
 
     if not physical_outputs:
-        discovered_outputs = discovered.get("prio_outputs", set())
-        _LOGGER.info(
-            "Discovered %s Physical RIO outputs: %s",
-            len(discovered_outputs),
-            sorted(discovered_outputs),
-        )
-        for output_num in discovered_outputs:
-            entities.append(
-                PhysicalRIOOutput(
-                    coordinator,
-                    entry,
-                    vmodid,
-                    output_num,
-                    None,
-                )
-            )
+        discovered_outputs = discovered.get("physical_rio_outputs", set())
+        _LOGGER.info("Discovered %s Physical RIO outputs", len(discovered_outputs))
+        entities += [
+            PhysicalRIOOutput(coordinator, entry, prio_outputs_topic, output_num)
+            for output_num in discovered_outputs
+        ]
     else:
-        for output_config in physical_outputs:
-            entities.append(
-                PhysicalRIOOutput(
-                    coordinator,
-                    entry,
-                    vmodid,
-                    output_config.get("output_number"),
-                    output_config.get("name"),
-                )
+        entities += [
+            PhysicalRIOOutput(
+                coordinator,
+                entry,
+                prio_outputs_topic,
+                output_config.get("output_number"),
+                output_config.get("name"),
             )
+            for output_config in physical_outputs
+        ]
 
     if not virtual_outputs:
-        discovered_vrio_outputs = discovered.get("vrio_outputs", set())
-        _LOGGER.info(
-            "Discovered %s Virtual RIO outputs: %s",
-            len(discovered_vrio_outputs),
-            sorted(discovered_vrio_outputs),
-        )
-        for output_num in discovered_vrio_outputs:
-            entities.append(
-                VirtualRIOOutput(
-                    coordinator,
-                    entry,
-                    vmodid,
-                    output_num,
-                    None,
-                )
-            )
+        discovered_vrio_outputs = discovered.get("virtual_rio_outputs", set())
+        _LOGGER.info("Discovered %s Virtual RIO outputs", len(discovered_vrio_outputs))
+        entities += [
+            VirtualRIOOutput(coordinator, entry, vrio_outputs_topic, output_num)
+            for output_num in discovered_vrio_outputs
+        ]
     else:
-        for output_config in virtual_outputs:
-            entities.append(
-                VirtualRIOOutput(
-                    coordinator,
-                    entry,
-                    vmodid,
-                    output_config.get("output_number"),
-                    output_config.get("name"),
-                )
+        entities += [
+            VirtualRIOOutput(
+                coordinator,
+                entry,
+                vrio_outputs_topic,
+                output_config.get("output_number"),
+                output_config.get("name"),
             )
+            for output_config in virtual_outputs
+        ]
 
     if not entities:
         _LOGGER.warning("No binary sensors configured. Add zones/outputs via integration options.")
@@ -189,52 +161,44 @@ async def async_setup_entry(
 class PhysicalRIOZone(CoordinatorEntity, BinarySensorEntity):
     """Representation of a Physical RIO Zone."""
 
+    _ON_PAYLOADS = OPEN_PAYLOADS
+
     def __init__(
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        topic_prefix: str,
         zone_number: int,
         name: str | None = None,
         device_class: BinarySensorDeviceClass = BinarySensorDeviceClass.DOOR,
     ) -> None:
         """Initialize the Physical RIO Zone."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._zone_number = zone_number
-        self._prio_topic = TOPIC_PRIO_INPUTS.format(vmodid=vmodid)
-        self._is_on = False
+        self._topic = f"{topic_prefix}/{zone_number}"
+        self._is_on: bool | None = None
 
-        self._attr_unique_id = f"{entry.entry_id}_prio_zone_{zone_number}"
+        self._attr_unique_id = f"{self._entry_id}_prio_zone_{zone_number}"
         self._attr_name = name or f"Zone {zone_number}"
         self._attr_device_class = device_class
         self._attr_device_info = physical_rio_device_info(entry)
 
-    async def _async_update_state(self, is_on: bool) -> None:
+    @callback
+    def _sync_update_state(self, is_on: bool) -> None:
         """Update state in the event loop."""
+        if is_on == self._is_on:
+            return
         self._is_on = is_on
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topics when added to hass."""
+        """Route MQTT updates for this entity's topic while it is added."""
         await super().async_added_to_hass()
-
-        topic = f"{self._prio_topic}/{self._zone_number}"
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            payload_upper = payload.strip().upper()
-            is_on = payload_upper == "OPEN"
-            # Schedule the state update to run in the Home Assistant event loop
-            self.hass.loop.call_soon_threadsafe(
-                lambda state=is_on: self.hass.async_create_task(self._async_update_state(state))
-            )
-
-        self.coordinator.subscribe(topic, handle_message)
+        self.async_on_remove(self.coordinator.async_add_route(self._topic, self))
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the zone is open."""
         return self._is_on
 
@@ -242,51 +206,43 @@ class PhysicalRIOZone(CoordinatorEntity, BinarySensorEntity):
 class PhysicalRIOOutput(CoordinatorEntity, BinarySensorEntity):
     """Representation of a Physical RIO Output."""
 
+    _ON_PAYLOADS = ON_PAYLOADS
+
     def __init__(
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        topic_prefix: str,
         output_number: int,
         name: str | None = None,
     ) -> None:
         """Initialize the Physical RIO Output."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._output_number = output_number
-        self._prio_topic = TOPIC_PRIO_OUTPUTS.format(vmodid=vmodid)
-        self._is_on = False
+        self._topic = f"{topic_prefix}/{output_number}"
+        self._is_on: bool | None = None
 
-        self._attr_unique_id = f"{entry.entry_id}_prio_output_{output_number}"
+        self._attr_unique_id = f"{self._entry_id}_prio_output_{output_number}"
         self._attr_name = name or f"Output {output_number}"
         self._attr_device_class = None
         self._attr_device_info = physical_rio_device_info(entry)
 
-    async def _async_update_state(self, is_on: bool) -> None:
+    @callback
+    def _sync_update_state(self, is_on: bool) -> None:
         """Update state in the event loop."""
+        if is_on == self._is_on:
+            return
         self._is_on = is_on
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topics when added to hass."""
+        """Route MQTT updates for this entity's topic while it is added."""
         await super().async_added_to_hass()
-
-        topic = f"{self._prio_topic}/{self._output_number}"
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            payload_upper = payload.strip().upper()
-            is_on = payload_upper == "ON"
-            # Schedule the state update to run in the Home Assistant event loop
-            self.hass.loop.call_soon_threadsafe(
-                lambda state=is_on: self.hass.async_create_task(self._async_update_state(state))
-            )
-
-        self.coordinator.subscribe(topic, handle_message)
+        self.async_on_remove(self.coordinator.async_add_route(self._topic, self))
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the output is on."""
         return self._is_on
 
@@ -294,50 +250,42 @@ class PhysicalRIOOutput(CoordinatorEntity, BinarySensorEntity):
 class VirtualRIOOutput(CoordinatorEntity, BinarySensorEntity):
     """Representation of a Virtual RIO Output."""
 
+    _ON_PAYLOADS = ON_PAYLOADS
+
     def __init__(
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        topic_prefix: str,
         output_number: int,
         name: str | None = None,
     ) -> None:
         """Initialize the Virtual RIO Output."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._output_number = output_number
-        self._vrio_topic = TOPIC_VRIO_OUTPUTS.format(vmodid=vmodid)
-        self._is_on = False
+        self._topic = f"{topic_prefix}/{output_number}"
+        self._is_on: bool | None = None
 
-        self._attr_unique_id = f"{entry.entry_id}_vrio_output_{output_number}"
+        self._attr_unique_id = f"{self._entry_id}_vrio_output_{output_number}"
         self._attr_name = name or f"Output {output_number}"
         self._attr_device_class = None
         self._attr_device_info = virtual_rio_device_info(entry)
 
-    async def _async_update_state(self, is_on: bool) -> None:
+    @callback
+    def _sync_update_state(self, is_on: bool) -> None:
         """Update state in the event loop."""
+        if is_on == self._is_on:
+            return
         self._is_on = is_on
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topics when added to hass."""
+        """Route MQTT updates for this entity's topic while it is added."""
         await super().async_added_to_hass()
-
-        topic = f"{self._vrio_topic}/{self._output_number}"
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            payload_upper = payload.strip().upper()
-            is_on = payload_upper == "ON"
-            # Schedule the state update to run in the Home Assistant event loop
-            self.hass.loop.call_soon_threadsafe(
-                lambda state=is_on: self.hass.async_create_task(self._async_update_state(state))
-            )
-
-        self.coordinator.subscribe(topic, handle_message)
+        self.async_on_remove(self.coordinator.async_add_route(self._topic, self))
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the output is on."""
         return self._is_on
@@ -16,24 +16,25 @@ from .device import virtual_keypad_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
-KEYPAD_BUTTONS = [
-    {"key": "1", "name": "Key 1", "icon": "mdi:numeric-1"},
-    {"key": "2", "name": "Key 2", "icon": "mdi:numeric-2"},
-    {"key": "3", "name": "Key 3", "icon": "mdi:numeric-3"},
-    {"key": "A", "name": "Key A>", "icon": "mdi:arrow-right-bold"},
-    {"key": "4", "name": "Key 4", "icon": "mdi:numeric-4"},
-    {"key": "5", "name": "Key 5", "icon": "mdi:numeric-5"},
-    {"key": "6", "name": "Key 6", "icon": "mdi:numeric-6"},
-    {"key": "B", "name": "Key B<", "icon": "mdi:arrow-left-bold"},
-    {"key": "7", "name": "Key 7", "icon": "mdi:numeric-7"},
-    {"key": "8", "name": "Key 8", "icon": "mdi:numeric-8"},
-    {"key": "9", "name": "Key 9", "icon": "mdi:numeric-9"},
-    {"key": "E", "name": "Enter", "icon": "mdi:check"},
-    {"key": "*", "name": "Asterisk", "icon": "mdi:asterisk"},
-    {"key": "0", "name": "Key 0", "icon": "mdi:numeric-0"},
-    {"key": "#", "name": "Hash", "icon": "mdi:pound"},
-    {"key": "X", "name": "Escape", "icon": "mdi:close"},
-]
+# (key, name, icon, unique_id suffix)
+KEYPAD_BUTTONS: tuple[tuple[str, str, str, str], ...] = (
+    ("1", "Key 1", "mdi:numeric-1", "1"),
+    ("2", "Key 2", "mdi:numeric-2", "2"),
+    ("3", "Key 3", "mdi:numeric-3", "3"),
+    ("A", "Key A>", "mdi:arrow-right-bold", "key_a"),
+    ("4", "Key 4", "mdi:numeric-4", "4"),
+    ("5", "Key 5", "mdi:numeric-5", "5"),
+    ("6", "Key 6", "mdi:numeric-6", "6"),
+    ("B", "Key B<", "mdi:arrow-left-bold", "key_b"),
+    ("7", "Key 7", "mdi:numeric-7", "7"),
+    ("8", "Key 8", "mdi:numeric-8", "8"),
+    ("9", "Key 9", "mdi:numeric-9", "9"),
+    ("E", "Enter", "mdi:check", "enter"),
+    ("*", "Asterisk", "mdi:asterisk", "asterisk"),
+    ("0", "Key 0", "mdi:numeric-0", "0"),
+    ("#", "Hash", "mdi:pound", "hash"),
+    ("X", "Escape", "mdi:close", "escape"),
+)
 
 
 async def async_setup_entry(
@@ -44,14 +45,12 @@ async def async_setup_entry(
     """Set up the Honeywell Galaxy Virtual Keypad buttons."""
     coordinator: GalaxyCoordinator = hass.data[DOMAIN][entry.entry_id]
     vmodid = entry.data.get("vmodid", "")
+    vkp_topic = TOPIC_VKP.format(vmodid=vmodid)
 
-    entities = []
-    for button_config in KEYPAD_BUTTONS:
-        entities.append(
-            KeypadButton(coordinator, entry, vmodid, button_config["key"], button_config["name"], button_config["icon"])
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        KeypadButton(coordinator, entry, vkp_topic, key, name, icon, unique_suffix)
+        for key, name, icon, unique_suffix in KEYPAD_BUTTONS
+    )
 
 
 class KeypadButton(CoordinatorEntity, ButtonEntity):
@@ -61,36 +60,25 @@ class KeypadButton(CoordinatorEntity, ButtonEntity):
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        topic_prefix: str,
         key: str,
         name: str,
         icon: str,
+        unique_suffix: str,
     ) -> None:
         """Initialize the keypad button."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._key = key
-        self._vkp_topic = TOPIC_VKP.format(vmodid=vmodid)
+        self._key_topic = f"{topic_prefix}/key"
 
-        key_name = key.lower().replace("*", "asterisk").replace("#", "hash")
-        if key_name == "a":
-            key_name = "key_a"
-        elif key_name == "b":
-            key_name = "key_b"
-        elif key_name == "e":
-            key_name = "enter"
-        elif key_name == "x":
-            key_name = "escape"
-        
-        self._attr_unique_id = f"{entry.entry_id}_keypad_button_{key_name}"
+        self._attr_unique_id = f"{self._entry_id}_keypad_button_{unique_suffix}"
         self._attr_name = name
         self._attr_icon = icon
         self._attr_device_info = virtual_keypad_device_info(entry)
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        topic = f"{self._vkp_topic}/key"
-        _LOGGER.info(f"Button pressed: {self._key}, publishing to {topic}")
-        self.coordinator.publish(topic, self._key)
-        _LOGGER.debug(f"Pressed keypad button: {self._key} -> {topic}")
+        _LOGGER.info("Button pressed: %s, publishing to %s", self._key, self._key_topic)
+        self.coordinator.publish(self._key_topic, self._key)
+        _LOGGER.debug("Pressed keypad button: %s -> %s", self._key, self._key_topic)
@@ -21,19 +21,21 @@ class InvalidHost(HomeAssistantError):
     """Error to indicate there is an invalid hostname."""
 
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_HOST): str,
-        vol.Required("port", default=1883): int,
-        vol.Optional("protocol", default="mqtt"): vol.In(["mqtt", "mqtts", "ws", "wss"]),
-        vol.Optional(CONF_USERNAME): str,
-        vol.Optional(CONF_PASSWORD): str,
-        vol.Required("vmodid"): str,
-    }
-)
-
-
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+_PROTOCOLS = ("mqtt", "mqtts", "ws", "wss")
+
+_USER_FIELDS = {
+    vol.Required(CONF_HOST): str,
+    vol.Required("port", default=1883): int,
+    vol.Optional("protocol", default="mqtt"): vol.In(_PROTOCOLS),
+    vol.Optional(CONF_USERNAME): str,
+    vol.Optional(CONF_PASSWORD): str,
+    vol.Required("vmodid"): str,
+}
+
+STEP_USER_DATA_SCHEMA = vol.Schema(_USER_FIELDS)
+
+
+def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     if not data.get(CONF_HOST):
         raise InvalidHost
@@ -58,7 +60,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         try:
-            info = await validate_input(self.hass, user_input)
+            info = validate_input(self.hass, user_input)
         except InvalidHost:
             errors["base"] = "invalid_host"
         except Exception:  # pylint: disable=broad-except
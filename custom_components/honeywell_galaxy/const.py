@@ -14,11 +14,25 @@ TOPIC_PRIO_OUTPUTS = "selfmon/vmod.{vmodid}/prio/outputs"
 TOPIC_SIA4_GROUPS = "selfmon/vmod.{vmodid}/sia4/groups"
 TOPIC_SIA4_EVENT = "selfmon/vmod.{vmodid}/sia4/event"
 
+# MQTT state payloads, matched after strip() and upper()
+OPEN_PAYLOADS = frozenset({"OPEN"})
+ON_PAYLOADS = frozenset({"ON"})
+
+# MQTT client timing
+MQTT_KEEPALIVE_SECONDS = 60
+MQTT_MISC_INTERVAL = 1
+MQTT_RECONNECT_MIN_SECONDS = 1
+MQTT_RECONNECT_MAX_SECONDS = 120
+# Window for collecting entity route topics into one SUBSCRIBE
+MQTT_SUBSCRIBE_BATCH_SECONDS = 0.1
+
+# Entry option key prefix for cached discovery results
+DISCOVERED_OPTION_PREFIX = "_discovered_"
+
 # MQTT discovery timing
 MQTT_CONNECT_MAX_SECONDS = 5
 DISCOVERY_MAX_SECONDS = 4
-DISCOVERY_IDLE_SECONDS = 1.0
-DISCOVERY_POLL_INTERVAL = 0.25
+DISCOVERY_IDLE_SECONDS = 0.5
 
 # Device types
 DEVICE_TYPE_VIRTUAL_KEYPAD = "virtual_keypad"
@@ -1,34 +1,57 @@
 """DataUpdateCoordinator for Honeywell Galaxy."""
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import logging
-from typing import Any, Callable
+import ssl
+import threading
+from typing import Any, Callable, Iterable
 
 import paho.mqtt.client as mqtt
+from paho.mqtt.client import MQTT_ERR_SUCCESS, error_string
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    MQTT_KEEPALIVE_SECONDS,
+    MQTT_MISC_INTERVAL,
+    MQTT_RECONNECT_MAX_SECONDS,
+    MQTT_RECONNECT_MIN_SECONDS,
+    MQTT_SUBSCRIBE_BATCH_SECONDS,
+)
+from .topic_trie import TopicTrie, is_wildcard_filter
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _topic_matches(topic: str, pattern: str) -> bool:
-    """Check if a topic matches a pattern (supports + and # wildcards)."""
-    if pattern == topic:
-        return True
-    
-    # Convert pattern to regex
-    import re
-    pattern_re = pattern.replace("+", "[^/]+").replace("#", ".*")
-    pattern_re = f"^{pattern_re}$"
-    return bool(re.match(pattern_re, topic))
+def _loop_read(client: mqtt.Client, sock) -> None:
+    """Read from the broker socket, draining data TLS has already decrypted.
+
+    One TLS record can carry several MQTT packets. loop_read handles a single
+    packet and leaves the rest in the SSL object's buffer, where the OS socket
+    no longer reports it readable, so keep reading while sock.pending() says
+    there is more. paho's own loop does the same.
+    """
+    rc = client.loop_read()
+    while (
+        rc == MQTT_ERR_SUCCESS
+        and isinstance(sock, ssl.SSLSocket)
+        and sock.pending()
+    ):
+        rc = client.loop_read()
 
 
 class GalaxyCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from MQTT."""
+    """Class to manage fetching data from MQTT.
+
+    The paho client is driven from the Home Assistant event loop through its
+    socket callbacks rather than loop_start(), so connect, disconnect and
+    message callbacks all run on the loop thread.
+    """
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize."""
@@ -39,8 +62,24 @@ class GalaxyCoordinator(DataUpdateCoordinator):
         )
         self.entry = entry
         self.client: mqtt.Client | None = None
-        self.connected = False
-        self.subscriptions: dict[str, list[Callable[[str, str], None]]] = {}
+        # Set while the broker connection is up; discovery waits on it
+        self.connected_event = asyncio.Event()
+        self._misc_timer: asyncio.TimerHandle | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        # Callbacks are kept in dicts used as ordered sets for O(1) removal
+        self.subscriptions: dict[str, dict[Callable[[str, str], None], None]] = {}
+        # Wildcard filters share their callback lists with self.subscriptions
+        self._wildcard_trie = TopicTrie()
+        # Exact topic -> entity whose _sync_update_state takes the payload match
+        self._routes: dict[str, Any] = {}
+        # Route topics waiting to go out together in one SUBSCRIBE
+        self._pending_route_topics: dict[str, None] = {}
+        self._route_flush: asyncio.TimerHandle | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return True while connected to the MQTT broker."""
+        return self.connected_event.is_set()
 
     async def async_config_entry_first_refresh(self) -> None:
         """Connect to MQTT on first refresh."""
@@ -67,161 +106,402 @@ class GalaxyCoordinator(DataUpdateCoordinator):
                 username_str = username if username is not None else ""
                 password_str = password if password is not None else ""
                 self.client.username_pw_set(username_str, password_str)
-                _LOGGER.debug(f"Setting MQTT credentials: username='{username_str}' (password {'set' if password_str else 'not set'})")
+                _LOGGER.debug(
+                    "Setting MQTT credentials: username='%s' (password %s)",
+                    username_str,
+                    "set" if password_str else "not set",
+                )
             else:
                 _LOGGER.debug("No MQTT credentials provided, connecting without authentication")
         except Exception as e:
-            _LOGGER.error(f"Failed to create MQTT client: {e}")
+            _LOGGER.error("Failed to create MQTT client: %s", e)
             return
 
         def on_connect(client, userdata, flags, rc):
             """Handle connection."""
             if rc == 0:
-                self.connected = True
-                _LOGGER.info(f"Connected to MQTT broker at {host}:{port}")
-                # Subscribe to all queued topics
-                # Make a copy of keys to avoid RuntimeError if subscriptions are modified during iteration
-                if self.subscriptions:
-                    topics_to_subscribe = list(self.subscriptions.keys())
-                    _LOGGER.info(f"Subscribing to {len(topics_to_subscribe)} topic(s) on connect")
-                    for topic in topics_to_subscribe:
-                        result = client.subscribe(topic, qos=0)
-                        if result[0] == mqtt.MQTT_ERR_SUCCESS:
-                            _LOGGER.info(f"Successfully subscribed to {topic} (QoS: {result[1]})")
-                        else:
-                            _LOGGER.error(f"Failed to subscribe to {topic}: {result[0]} - {mqtt.error_string(result[0])}")
+                self.connected_event.set()
+                _LOGGER.info("Connected to MQTT broker at %s:%s", host, port)
+                # Resubscribe to every queued topic with a single SUBSCRIBE
+                self._pending_route_topics.clear()
+                topics = dict.fromkeys([*self.subscriptions, *self._routes])
+                if topics:
+                    _LOGGER.info("Subscribing to %s topic(s) on connect", len(topics))
+                    self._subscribe_topics(topics)
                 else:
                     _LOGGER.info("No topics to subscribe to on connect")
             elif rc == 5:
-                self.connected = False
-                _LOGGER.error(f"MQTT authentication failed (not authorised). Check username/password. RC: {rc}")
-                _LOGGER.error(f"Attempted connection with username: '{username if username else '(none)'}'")
+                self.connected_event.clear()
+                _LOGGER.error(
+                    "MQTT authentication failed (not authorised). Check username/password. RC: %s",
+                    rc,
+                )
+                _LOGGER.error(
+                    "Attempted connection with username: '%s'",
+                    username if username else "(none)",
+                )
             else:
-                self.connected = False
-                _LOGGER.error(f"Failed to connect to MQTT broker: {rc} - {mqtt.error_string(rc)}")
+                self.connected_event.clear()
+                _LOGGER.error(
+                    "Failed to connect to MQTT broker: %s - %s",
+                    rc,
+                    error_string(rc),
+                )
 
         def on_disconnect(client, userdata, rc):
             """Handle disconnection."""
-            self.connected = False
+            self.connected_event.clear()
             _LOGGER.warning("Disconnected from MQTT broker")
+            if rc != 0 and client is self.client:
+                self._async_schedule_reconnect()
 
         def on_message(client, userdata, msg):
             """Handle incoming message."""
             topic = msg.topic
-            try:
-                payload = msg.payload.decode("utf-8")
-            except UnicodeDecodeError:
-                _LOGGER.warning(f"Failed to decode payload for {topic}, using raw bytes")
-                payload = str(msg.payload)
-            
-            # Check for exact topic match first
-            if topic in self.subscriptions:
-                _LOGGER.info(f"Received MQTT message on subscribed topic {topic}: {payload}")
-                _LOGGER.debug(f"Found {len(self.subscriptions[topic])} callback(s) for topic {topic}")
-                for callback in self.subscriptions[topic]:
+            entity = self._routes.get(topic)
+            # Exact subscriptions are keyed by topic, so they need a single lookup
+            callbacks = self.subscriptions.get(topic)
+            # Only wildcard subscriptions need pattern matching, and the walk is
+            # skipped entirely while none are registered
+            wildcard_matches = (
+                list(self._wildcard_trie.iter_matches(topic.split("/")))
+                if self._wildcard_trie
+                else []
+            )
+
+            if entity is None and callbacks is None and not wildcard_matches:
+                # Log unmatched topics for debugging (at debug level to avoid spam)
+                _LOGGER.debug(
+                    "Received message on unsubscribed topic: %s (subscribed topics: %s)",
+                    topic,
+                    self.subscriptions.keys(),
+                )
+                return
+
+            # Decode only once something matched, and share it between callbacks;
+            # invalid UTF-8 becomes U+FFFD rather than a bytes repr
+            payload = msg.payload.decode("utf-8", "replace")
+
+            # Routed entities take the payload directly, without a handler hop
+            if entity is not None:
+                try:
+                    entity._sync_update_state(
+                        payload.strip().upper() in entity._ON_PAYLOADS
+                    )
+                except Exception as e:
+                    _LOGGER.error(
+                        "Error updating entity for %s: %s",
+                        topic,
+                        e,
+                        exc_info=True,
+                    )
+
+            if callbacks is not None:
+                _LOGGER.debug("Received MQTT message on subscribed topic %s: %s", topic, payload)
+                _LOGGER.debug(
+                    "Found %s callback(s) for topic %s",
+                    len(callbacks),
+                    topic,
+                )
+                for handler in callbacks:
                     try:
-                        callback(topic, payload)
-                        _LOGGER.debug(f"Successfully called callback for {topic}")
+                        handler(topic, payload)
+                        _LOGGER.debug("Successfully called callback for %s", topic)
                     except Exception as e:
-                        _LOGGER.error(f"Error in callback for {topic}: {e}", exc_info=True)
-            else:
-                # Check for wildcard topic matches
-                matched = False
-                for sub_topic, callbacks in self.subscriptions.items():
-                    if _topic_matches(topic, sub_topic):
-                        matched = True
-                        _LOGGER.info(f"Received MQTT message on wildcard topic {sub_topic} (matched: {topic}): {payload}")
-                        for callback in callbacks:
-                            try:
-                                callback(topic, payload)
-                                _LOGGER.debug(f"Successfully called callback for wildcard {sub_topic}")
-                            except Exception as e:
-                                _LOGGER.error(f"Error in callback for wildcard {sub_topic}: {e}", exc_info=True)
-                        break
-                
-                if not matched:
-                    # Log unmatched topics for debugging (at debug level to avoid spam)
-                    _LOGGER.debug(f"Received message on unsubscribed topic: {topic} (subscribed topics: {list(self.subscriptions.keys())})")
+                        _LOGGER.error(
+                            "Error in callback for %s: %s",
+                            topic,
+                            e,
+                            exc_info=True,
+                        )
+
+            for sub_topic, callbacks in wildcard_matches:
+                _LOGGER.debug(
+                    "Received MQTT message on wildcard topic %s (matched: %s): %s",
+                    sub_topic,
+                    topic,
+                    payload,
+                )
+                for handler in callbacks:
+                    try:
+                        handler(topic, payload)
+                        _LOGGER.debug(
+                            "Successfully called callback for wildcard %s",
+                            sub_topic,
+                        )
+                    except Exception as e:
+                        _LOGGER.error(
+                            "Error in callback for wildcard %s: %s",
+                            sub_topic,
+                            e,
+                            exc_info=True,
+                        )
 
         self.client.on_connect = on_connect
         self.client.on_disconnect = on_disconnect
         self.client.on_message = on_message
+        self.client.on_socket_open = self._on_socket_open
+        self.client.on_socket_close = self._on_socket_close
+        self.client.on_socket_register_write = self._on_socket_register_write
+        self.client.on_socket_unregister_write = self._on_socket_unregister_write
 
         if protocol in ["mqtts", "wss"]:
-            import ssl
             self.client.tls_set(cert_reqs=ssl.CERT_NONE)
 
         try:
             if protocol in ["ws", "wss"]:
                 _LOGGER.warning("WebSocket transport not fully supported, using TCP")
             
-            _LOGGER.info(f"Attempting to connect to MQTT broker at {host}:{port} (protocol: {protocol})")
-            result = self.client.connect(host, port, keepalive=60)
-            if result == mqtt.MQTT_ERR_SUCCESS:
-                self.client.loop_start()
-                _LOGGER.info("MQTT client loop started, waiting for connection...")
+            _LOGGER.info(
+                "Attempting to connect to MQTT broker at %s:%s (protocol: %s)",
+                host,
+                port,
+                protocol,
+            )
+            # The socket connect and TLS handshake block, so keep them off the loop
+            result = await self.hass.async_add_executor_job(
+                self.client.connect, host, port, MQTT_KEEPALIVE_SECONDS
+            )
+            if result == MQTT_ERR_SUCCESS:
+                _LOGGER.info("MQTT socket open, waiting for connection...")
             else:
-                _LOGGER.error(f"Failed to initiate MQTT connection: {result} - {mqtt.error_string(result)}")
-                self.connected = False
+                _LOGGER.error(
+                    "Failed to initiate MQTT connection: %s - %s",
+                    result,
+                    error_string(result),
+                )
         except Exception as e:
-            _LOGGER.error(f"Exception connecting to MQTT broker: {e}", exc_info=True)
-            self.connected = False
+            _LOGGER.error("Exception connecting to MQTT broker: %s", e, exc_info=True)
+            self._async_schedule_reconnect()
+
+    def _run_on_loop(self, func: Callable[..., None], *args: Any) -> None:
+        """Run func on the event loop, only hopping threads when required."""
+        if threading.get_ident() == self.hass.loop_thread_id:
+            func(*args)
+        else:
+            self.hass.loop.call_soon_threadsafe(func, *args)
+
+    def _on_socket_open(self, client: mqtt.Client, userdata: Any, sock) -> None:
+        """Start reading from the broker socket on the event loop."""
+        self._run_on_loop(self._async_on_socket_open, client, sock)
+
+    @callback
+    def _async_on_socket_open(self, client: mqtt.Client, sock) -> None:
+        """Register the socket reader and start keepalive housekeeping."""
+        self.hass.loop.add_reader(sock, _loop_read, client, sock)
+        self._async_schedule_misc(client)
+
+    def _on_socket_close(self, client: mqtt.Client, userdata: Any, sock) -> None:
+        """Stop watching the broker socket."""
+        # paho closes the socket right after this callback, so pass the fd
+        self._run_on_loop(self._async_on_socket_close, sock.fileno())
+
+    @callback
+    def _async_on_socket_close(self, fileno: int) -> None:
+        """Remove socket watchers and stop keepalive housekeeping."""
+        self.hass.loop.remove_reader(fileno)
+        self.hass.loop.remove_writer(fileno)
+        if self._misc_timer is not None:
+            self._misc_timer.cancel()
+            self._misc_timer = None
+
+    def _on_socket_register_write(
+        self, client: mqtt.Client, userdata: Any, sock
+    ) -> None:
+        """Flush queued packets once the socket is writable."""
+        self._run_on_loop(self.hass.loop.add_writer, sock, client.loop_write)
+
+    def _on_socket_unregister_write(
+        self, client: mqtt.Client, userdata: Any, sock
+    ) -> None:
+        """Stop waiting for writability once the outgoing queue is empty."""
+        self._run_on_loop(self.hass.loop.remove_writer, sock.fileno())
+
+    @callback
+    def _async_schedule_misc(self, client: mqtt.Client) -> None:
+        """Run paho keepalive and retry housekeeping periodically."""
+
+        @callback
+        def _misc() -> None:
+            self._misc_timer = None
+            if client.loop_misc() == MQTT_ERR_SUCCESS:
+                self._async_schedule_misc(client)
+
+        if self._misc_timer is not None:
+            self._misc_timer.cancel()
+        self._misc_timer = self.hass.loop.call_later(MQTT_MISC_INTERVAL, _misc)
+
+    @callback
+    def _async_schedule_reconnect(self) -> None:
+        """Start reconnecting to the broker with exponential backoff."""
+        if self.client is None or (
+            self._reconnect_task is not None and not self._reconnect_task.done()
+        ):
+            return
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._async_reconnect(self.client), f"{DOMAIN} MQTT reconnect"
+        )
+
+    async def _async_reconnect(self, client: mqtt.Client) -> None:
+        """Reconnect to the broker until it succeeds or the client is replaced."""
+        delay = MQTT_RECONNECT_MIN_SECONDS
+        while client is self.client:
+            await asyncio.sleep(delay)
+            try:
+                await self.hass.async_add_executor_job(client.reconnect)
+            except Exception as e:
+                _LOGGER.warning("MQTT reconnect failed, retrying in %ss: %s", delay, e)
+                delay = min(delay * 2, MQTT_RECONNECT_MAX_SECONDS)
+            else:
+                return
 
     def subscribe(self, topic: str, callback: Callable[[str, str], None]) -> None:
         """Subscribe to an MQTT topic."""
-        if topic not in self.subscriptions:
-            self.subscriptions[topic] = []
-        self.subscriptions[topic].append(callback)
-        _LOGGER.info(f"Registered subscription callback for {topic} (total callbacks: {len(self.subscriptions[topic])})")
+        callbacks = self.subscriptions.get(topic)
+        if callbacks is None:
+            callbacks = self.subscriptions[topic] = {}
+            # Literal filters are only ever matched by the exact dict lookup
+            if is_wildcard_filter(topic):
+                self._wildcard_trie.insert(topic, callbacks)
+        callbacks[callback] = None
+        _LOGGER.info(
+            "Registered subscription callback for %s (total callbacks: %s)",
+            topic,
+            len(self.subscriptions[topic]),
+        )
 
         # Always try to subscribe if client exists, even if not yet connected
         # The subscription will be retried on connect
         if self.client:
             if self.connected:
                 result = self.client.subscribe(topic, qos=0)
-                if result[0] == mqtt.MQTT_ERR_SUCCESS:
-                    _LOGGER.info(f"Subscribed to {topic} (QoS: {result[1]})")
+                if result[0] == MQTT_ERR_SUCCESS:
+                    _LOGGER.info("Subscribed to %s (QoS: %s)", topic, result[1])
                 else:
-                    _LOGGER.error(f"Failed to subscribe to {topic}: {result[0]} - {mqtt.error_string(result[0])}")
+                    _LOGGER.error(
+                        "Failed to subscribe to %s: %s - %s",
+                        topic,
+                        result[0],
+                        error_string(result[0]),
+                    )
+            else:
+                _LOGGER.info(
+                    "Subscription queued for %s (will subscribe when MQTT connects)",
+                    topic,
+                )
+        else:
+            _LOGGER.info(
+                "Subscription queued for %s (MQTT client not yet created)",
+                topic,
+            )
+
+    @callback
+    def async_add_route(self, topic: str, entity: Any) -> Callable[[], None]:
+        """Route an exact topic straight to an added entity's state update.
+
+        The entity must provide an _ON_PAYLOADS collection of upper-case
+        payloads and a _sync_update_state(is_on) callback. Call this from
+        async_added_to_hass; topics added while a platform sets up are
+        subscribed together in one SUBSCRIBE packet. Returns a function that
+        removes the route.
+        """
+        self._routes[topic] = entity
+        self._pending_route_topics[topic] = None
+        if self._route_flush is None:
+            self._route_flush = self.hass.loop.call_later(
+                MQTT_SUBSCRIBE_BATCH_SECONDS, self._async_flush_route_topics
+            )
+        return partial(self.unregister_route, topic)
+
+    @callback
+    def _async_flush_route_topics(self) -> None:
+        """Subscribe to the route topics added since the last flush."""
+        self._route_flush = None
+        topics = self._pending_route_topics
+        if not topics:
+            return
+        self._pending_route_topics = {}
+        _LOGGER.info("Registered %s entity route(s)", len(topics))
+        self._subscribe_topics(topics)
+
+    def unregister_route(self, topic: str) -> None:
+        """Stop routing a topic to its entity.
+
+        The broker subscription is left in place until the next reconnect, so
+        removing many entities at unload does not send one UNSUBSCRIBE each.
+        """
+        self._routes.pop(topic, None)
+        self._pending_route_topics.pop(topic, None)
+
+    def _subscribe_topics(self, topics: Iterable[str]) -> None:
+        """Send one SUBSCRIBE for topics, or leave them queued until connect."""
+        topics = list(topics)
+        if self.client and self.connected:
+            result = self.client.subscribe([(topic, 0) for topic in topics])
+            if result[0] == MQTT_ERR_SUCCESS:
+                _LOGGER.info("Subscribed to %s topic(s) in one request", len(topics))
             else:
-                _LOGGER.info(f"Subscription queued for {topic} (will subscribe when MQTT connects)")
+                _LOGGER.error(
+                    "Failed to subscribe to %s topic(s): %s - %s",
+                    len(topics),
+                    result[0],
+                    error_string(result[0]),
+                )
         else:
-            _LOGGER.info(f"Subscription queued for {topic} (MQTT client not yet created)")
+            _LOGGER.info(
+                "Subscriptions queued for %s topic(s) (will subscribe when MQTT connects)",
+                len(topics),
+            )
 
     def unsubscribe(self, topic: str, callback: Callable[[str, str], None]) -> None:
         """Unsubscribe from an MQTT topic."""
-        if topic in self.subscriptions:
-            if callback in self.subscriptions[topic]:
-                self.subscriptions[topic].remove(callback)
-            if not self.subscriptions[topic]:
+        callbacks = self.subscriptions.get(topic)
+        if callbacks is not None:
+            callbacks.pop(callback, None)
+            if not callbacks:
                 del self.subscriptions[topic]
-                if self.client and self.connected:
+                if is_wildcard_filter(topic):
+                    self._wildcard_trie.remove(topic)
+                if topic not in self._routes and self.client and self.connected:
                     self.client.unsubscribe(topic)
-                    _LOGGER.debug(f"Unsubscribed from {topic}")
+                    _LOGGER.debug("Unsubscribed from %s", topic)
 
     def publish(self, topic: str, payload: str) -> None:
         """Publish to an MQTT topic."""
         if not self.client:
-            _LOGGER.error(f"Cannot publish to {topic}: MQTT client not initialized")
+            _LOGGER.error("Cannot publish to %s: MQTT client not initialized", topic)
             return
         
         if not self.connected:
-            _LOGGER.error(f"Cannot publish to {topic}: MQTT not connected")
+            _LOGGER.error("Cannot publish to %s: MQTT not connected", topic)
             return
         
         try:
             result = self.client.publish(topic, payload, qos=0, retain=False)
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                _LOGGER.info(f"Published to {topic}: {payload}")
+            if result.rc == MQTT_ERR_SUCCESS:
+                _LOGGER.info("Published to %s: %s", topic, payload)
             else:
-                _LOGGER.error(f"Failed to publish to {topic}: {result.rc} - {mqtt.error_string(result.rc)}")
+                _LOGGER.error(
+                    "Failed to publish to %s: %s - %s",
+                    topic,
+                    result.rc,
+                    error_string(result.rc),
+                )
         except Exception as e:
-            _LOGGER.error(f"Exception publishing to {topic}: {e}")
+            _LOGGER.error("Exception publishing to %s: %s", topic, e)
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._route_flush is not None:
+            self._route_flush.cancel()
+            self._route_flush = None
         if self.client:
-            self.client.loop_stop()
-            self.client.disconnect()
+            client = self.client
             self.client = None
-        self.connected = False
+            client.disconnect()
+            # Flush DISCONNECT now; paho closes the socket once it is sent
+            client.loop_write()
+        self.connected_event.clear()
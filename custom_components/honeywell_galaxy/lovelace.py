@@ -5,12 +5,14 @@ import asyncio
 import inspect
 import logging
 from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import yaml
 import voluptuous as vol
 
+from homeassistant.components import persistent_notification
 from homeassistant.components.lovelace.const import (
     CONF_ALLOW_SINGLE_WORD,
     CONF_ICON,
@@ -25,7 +27,8 @@ from homeassistant.components.lovelace.const import (
 )
 from homeassistant.components.lovelace.dashboard import DashboardsCollection, LovelaceStorage
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
@@ -61,9 +64,14 @@ GALAXY_VIEW_TITLES = frozenset(
 GALAXY_VIEW_PATHS = frozenset({"galaxy", "security"})
 GALAXY_KEYPAD_URL_PATH = "galaxy-keypad"
 LEGACY_GALAXY_KEYPAD_URL_PATH = "security"
-DEFAULT_CARD_SETUP_DELAY = 50
+DEFAULT_CARD_SETUP_WAIT = 30
 CARD_SETUP_RETRIES = (0, 45, 90)
 CARD_RESCHEDULE_DELAY = 10
+# Upper bound on waiting for MQTT-discovered entities before building cards
+DISCOVERED_ENTITY_WAIT = 60
+# Quiet period that marks the end of a platform's entity registration burst
+ENTITY_SETTLE_SECONDS = 1
+KEYPAD_CARD_TEMPLATE_PATH = Path(__file__).parent / "keypad_card_template.yaml"
 
 # Fallback Lovelace resource URLs when www/community scanning finds nothing.
 BUTTON_CARD_RESOURCE_URLS = (
@@ -113,6 +121,36 @@ DEFAULT_GALAXY_KEYPAD_DASHBOARD_ITEM = {
     CONF_URL_PATH: GALAXY_KEYPAD_URL_PATH,
 }
 
+STACK_CARD_TYPES = frozenset({"horizontal-stack", "vertical-stack", "grid"})
+
+# Unique id kinds, after the "<entry_id>_" prefix, for single entities
+SINGLE_ENTITY_KINDS = {
+    "keypad_display_line1": "display_line1",
+    "keypad_display_line2": "display_line2",
+    "printer_log": "printer_log",
+    "alarm_reporting_log": "alarm_reporting_log",
+}
+
+# Numbered unique id kind -> (collection key, number field)
+NUMBERED_ENTITY_KINDS = {
+    "prio_zone": ("prio_zones", "zone_number"),
+    "prio_output": ("prio_outputs", "output_number"),
+    "vrio_zone": ("vrio_zones", "zone_number"),
+    "vrio_output": ("vrio_outputs", "output_number"),
+    "group": ("groups", "group_number"),
+}
+
+DEVICE_TYPE_ENTITY_KINDS = {
+    DEVICE_TYPE_VIRTUAL_KEYPAD: frozenset(
+        {"keypad_display_line1", "keypad_display_line2"}
+    ),
+    DEVICE_TYPE_VIRTUAL_PRINTER: frozenset({"printer_log"}),
+    DEVICE_TYPE_ALARM_REPORTING: frozenset({"alarm_reporting_log"}),
+    DEVICE_TYPE_PHYSICAL_RIO: frozenset({"prio_zone", "prio_output"}),
+    DEVICE_TYPE_VIRTUAL_RIO: frozenset({"vrio_zone", "vrio_output"}),
+    DEVICE_TYPE_GROUPS: frozenset({"group"}),
+}
+
 
 def _is_dedicated_galaxy_dashboard(dashboard_id: str | None) -> bool:
     """Return True for the integration's standalone keypad dashboard."""
@@ -334,77 +372,51 @@ def _empty_entity_collection() -> dict[str, Any]:
     }
 
 
+def _split_unique_id(unique_id: str, prefix: str) -> tuple[str, int | None] | None:
+    """Return (kind, number) for a Galaxy unique id, or None if unknown.
+
+    prefix is "<entry_id>_"; number is None for single entities.
+    """
+    if not unique_id.startswith(prefix):
+        return None
+    local_id = unique_id[len(prefix) :]
+    if local_id in SINGLE_ENTITY_KINDS:
+        return local_id, None
+    kind, _, number = local_id.rpartition("_")
+    if kind in NUMBERED_ENTITY_KINDS and number.isdigit():
+        return kind, int(number)
+    return None
+
+
 def _classify_entity(
-    collected: dict[str, Any], unique_id: str, entity_id: str, entry_id: str
+    collected: dict[str, Any], kind: str, number: int | None, entity_id: str
 ) -> None:
     """Add a single entity into the collected structure."""
-    if unique_id.endswith("_keypad_display_line1"):
-        collected["entities"]["display_line1"] = entity_id
-    elif unique_id.endswith("_keypad_display_line2"):
-        collected["entities"]["display_line2"] = entity_id
-    elif unique_id.endswith("_printer_log"):
-        collected["entities"]["printer_log"] = entity_id
-    elif unique_id.endswith("_alarm_reporting_log"):
-        collected["entities"]["alarm_reporting_log"] = entity_id
-    elif unique_id.startswith(f"{entry_id}_prio_zone_"):
-        zone_num = unique_id.replace(f"{entry_id}_prio_zone_", "")
-        collected["prio_zones"].append({"entity_id": entity_id, "zone_number": zone_num})
-    elif unique_id.startswith(f"{entry_id}_prio_output_"):
-        output_num = unique_id.replace(f"{entry_id}_prio_output_", "")
-        collected["prio_outputs"].append(
-            {"entity_id": entity_id, "output_number": output_num}
-        )
-    elif unique_id.startswith(f"{entry_id}_vrio_output_"):
-        output_num = unique_id.replace(f"{entry_id}_vrio_output_", "")
-        collected["vrio_outputs"].append(
-            {"entity_id": entity_id, "output_number": output_num}
-        )
-    elif unique_id.startswith(f"{entry_id}_vrio_zone_"):
-        zone_num = unique_id.replace(f"{entry_id}_vrio_zone_", "")
-        collected["vrio_zones"].append({"entity_id": entity_id, "zone_number": zone_num})
-    elif unique_id.startswith(f"{entry_id}_group_"):
-        group_num = unique_id.replace(f"{entry_id}_group_", "")
-        collected["groups"].append({"entity_id": entity_id, "group_number": group_num})
-
-
-def _entity_belongs_to_device_type(
-    unique_id: str, entry_id: str, device_type: str
-) -> bool:
-    """Return True when an entity unique id belongs to a Galaxy device type."""
-    if device_type == DEVICE_TYPE_VIRTUAL_KEYPAD:
-        return unique_id.endswith(("_keypad_display_line1", "_keypad_display_line2"))
-    if device_type == DEVICE_TYPE_VIRTUAL_PRINTER:
-        return unique_id.endswith("_printer_log")
-    if device_type == DEVICE_TYPE_ALARM_REPORTING:
-        return unique_id.endswith("_alarm_reporting_log")
-    if device_type == DEVICE_TYPE_PHYSICAL_RIO:
-        return unique_id.startswith(f"{entry_id}_prio_zone_") or unique_id.startswith(
-            f"{entry_id}_prio_output_"
-        )
-    if device_type == DEVICE_TYPE_VIRTUAL_RIO:
-        return unique_id.startswith(f"{entry_id}_vrio_zone_") or unique_id.startswith(
-            f"{entry_id}_vrio_output_"
-        )
-    if device_type == DEVICE_TYPE_GROUPS:
-        return unique_id.startswith(f"{entry_id}_group_")
-    return False
+    key = SINGLE_ENTITY_KINDS.get(kind)
+    if key is not None:
+        collected["entities"][key] = entity_id
+        return
+    collection_key, number_field = NUMBERED_ENTITY_KINDS[kind]
+    collected[collection_key].append({"entity_id": entity_id, number_field: number})
 
 
-def _collect_entities_for_device_type(
-    entity_registry: er.EntityRegistry, entry_id: str, device_type: str
+def _collect_entities_for_kinds(
+    entity_registry: er.EntityRegistry,
+    entry_id: str,
+    kinds: frozenset[str] | None = None,
 ) -> dict[str, Any]:
-    """Collect entities for one Honeywell Galaxy device type."""
+    """Collect entities for a config entry, optionally limited to some kinds."""
     collected = _empty_entity_collection()
+    prefix = f"{entry_id}_"
 
     for entity_entry in er.async_entries_for_config_entry(entity_registry, entry_id):
         unique_id = entity_entry.unique_id
         if unique_id is None:
             continue
-        if not _entity_belongs_to_device_type(unique_id, entry_id, device_type):
+        parsed = _split_unique_id(unique_id, prefix)
+        if parsed is None or (kinds is not None and parsed[0] not in kinds):
             continue
-        _classify_entity(
-            collected, unique_id, entity_entry.entity_id, entry_id
-        )
+        _classify_entity(collected, *parsed, entity_entry.entity_id)
 
     return collected
 
@@ -413,17 +425,97 @@ def _collect_all_entities(
     entity_registry: er.EntityRegistry, entry_id: str
 ) -> dict[str, Any]:
     """Collect all Honeywell Galaxy entities for a config entry."""
-    collected = _empty_entity_collection()
+    return _collect_entities_for_kinds(entity_registry, entry_id)
 
-    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry_id):
-        unique_id = entity_entry.unique_id
-        if unique_id is None:
-            continue
-        _classify_entity(
-            collected, unique_id, entity_entry.entity_id, entry_id
+
+async def _wait_for_keypad_display_entities(
+    hass: HomeAssistant, entry_id: str, timeout: float
+) -> bool:
+    """Wait until both keypad display sensors are in the entity registry."""
+    entity_registry = er.async_get(hass)
+    unique_ids = (
+        f"{entry_id}_keypad_display_line1",
+        f"{entry_id}_keypad_display_line2",
+    )
+
+    def _registered() -> bool:
+        return all(
+            entity_registry.async_get_entity_id(Platform.SENSOR, DOMAIN, unique_id)
+            is not None
+            for unique_id in unique_ids
         )
 
-    return collected
+    if _registered():
+        return True
+
+    ready = asyncio.Event()
+
+    @callback
+    def _entity_registry_updated(event: Event) -> None:
+        if event.data.get("action") == "create" and _registered():
+            ready.set()
+
+    unsub = hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED, _entity_registry_updated
+    )
+    try:
+        await asyncio.wait_for(ready.wait(), timeout)
+    except TimeoutError:
+        return _registered()
+    finally:
+        unsub()
+    return True
+
+
+async def _wait_for_entity_kinds(
+    hass: HomeAssistant, entry_id: str, kinds: frozenset[str], timeout: float
+) -> None:
+    """Wait for entities of the given kinds to finish registering.
+
+    Returns once ENTITY_SETTLE_SECONDS pass without another matching entity
+    after the first one, or after timeout.
+    """
+    entity_registry = er.async_get(hass)
+    prefix = f"{entry_id}_"
+    loop = asyncio.get_running_loop()
+    settled = asyncio.Event()
+    settle_timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def _entity_registry_updated(event: Event) -> None:
+        nonlocal settle_timer
+        if event.data.get("action") != "create":
+            return
+        entity_entry = entity_registry.async_get(event.data["entity_id"])
+        if entity_entry is None or entity_entry.unique_id is None:
+            return
+        parsed = _split_unique_id(entity_entry.unique_id, prefix)
+        if parsed is None or parsed[0] not in kinds:
+            return
+        # A platform registers its entities in a burst; wait for it to end
+        if settle_timer is not None:
+            settle_timer.cancel()
+        settle_timer = loop.call_later(ENTITY_SETTLE_SECONDS, settled.set)
+
+    unsub = hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED, _entity_registry_updated
+    )
+    try:
+        await asyncio.wait_for(settled.wait(), timeout)
+    except TimeoutError:
+        pass
+    finally:
+        unsub()
+        if settle_timer is not None:
+            settle_timer.cancel()
+
+
+def _has_discovered_entities(collected: dict[str, Any]) -> bool:
+    """Return True if any MQTT-discovered entity has been collected."""
+    return any(
+        collected[collection_key]
+        for collection_key, _ in NUMBERED_ENTITY_KINDS.values()
+    )
 
 
 async def _wait_for_entities(
@@ -431,59 +523,71 @@ async def _wait_for_entities(
 ) -> dict[str, Any]:
     """Wait for keypad display entities and MQTT discovery before building cards."""
     entity_registry = er.async_get(hass)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
 
-    for second in range(timeout):
-        collected = _collect_entities(entity_registry, entry_id)
-        entities = collected["entities"]
-        if not entities.get("display_line1") or not entities.get("display_line2"):
-            await asyncio.sleep(1)
-            continue
+    if not await _wait_for_keypad_display_entities(hass, entry_id, timeout):
+        return _collect_entities(entity_registry, entry_id)
 
-        discovered = (
-            collected["prio_zones"]
-            or collected["prio_outputs"]
-            or collected["groups"]
-            or collected["vrio_zones"]
-            or collected["vrio_outputs"]
+    collected = _collect_entities(entity_registry, entry_id)
+    if not _has_discovered_entities(collected):
+        remaining = timeout - (loop.time() - started)
+        await _wait_for_entity_kinds(
+            hass,
+            entry_id,
+            frozenset(NUMBERED_ENTITY_KINDS),
+            min(remaining, DISCOVERED_ENTITY_WAIT),
         )
-        if discovered or second >= 60:
-            _LOGGER.info(
-                "Entity collection ready after %ss: %s zones, %s groups",
-                second,
-                len(collected["prio_zones"]),
-                len(collected["groups"]),
-            )
-            return collected
-        await asyncio.sleep(1)
+        collected = _collect_entities(entity_registry, entry_id)
+
+    _LOGGER.info(
+        "Entity collection ready after %.1fs: %s zones, %s groups",
+        loop.time() - started,
+        len(collected["prio_zones"]),
+        len(collected["groups"]),
+    )
+    return collected
+
+
+def _read_keypad_card_template() -> Any:
+    """Parse the bundled Galaxy Keypad card template."""
+    try:
+        return yaml.safe_load(KEYPAD_CARD_TEMPLATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as err:
+        _LOGGER.error("Failed to load keypad card template: %s", err)
+        return None
+
+
+# Parsed once at import; placeholders are whole scalar values in the template
+_KEYPAD_CARD_TEMPLATE = _read_keypad_card_template()
 
-    return _collect_entities(entity_registry, entry_id)
 
+def _fill_template(node: Any, replacements: dict[str, str]) -> Any:
+    """Return a copy of a parsed template with placeholder values replaced."""
+    if isinstance(node, dict):
+        return {key: _fill_template(value, replacements) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill_template(value, replacements) for value in node]
+    if isinstance(node, str):
+        return replacements.get(node, node)
+    return node
 
-async def _load_keypad_card(
+
+def _load_keypad_card(
     entry: ConfigEntry, display_line1: str, display_line2: str
 ) -> dict | None:
-    """Load and populate the Galaxy Keypad card template."""
-    vmodid = entry.data.get("vmodid", "")
-    mqtt_topic = f"{TOPIC_VKP.format(vmodid=vmodid)}/key"
-    template_path = Path(__file__).parent / "keypad_card_template.yaml"
-
-    try:
-        loop = asyncio.get_event_loop()
-        template_content = await loop.run_in_executor(
-            None, lambda: template_path.read_text(encoding="utf-8")
-        )
-        replacements = {
-            "XXXXXX_DISPLAY_LINE_1": display_line1,
-            "XXXXXX_DISPLAY_LINE_2": display_line2,
-            "XXXXXX_MQTT_TOPIC": mqtt_topic,
-        }
-        for placeholder, value in replacements.items():
-            template_content = template_content.replace(placeholder, value)
-        return yaml.safe_load(template_content)
-    except Exception as err:
-        _LOGGER.error("Failed to load keypad card template: %s", err, exc_info=True)
+    """Populate the Galaxy Keypad card template."""
+    if _KEYPAD_CARD_TEMPLATE is None:
         return None
 
+    vmodid = entry.data.get("vmodid", "")
+    replacements = {
+        "XXXXXX_DISPLAY_LINE_1": display_line1,
+        "XXXXXX_DISPLAY_LINE_2": display_line2,
+        "XXXXXX_MQTT_TOPIC": f"{TOPIC_VKP.format(vmodid=vmodid)}/key",
+    }
+    return _fill_template(_KEYPAD_CARD_TEMPLATE, replacements)
+
 
 def _entities_card(title: str, entity_ids: list[str], **kwargs: Any) -> dict:
     """Build a standard entities card."""
@@ -558,7 +662,7 @@ def _build_entity_cards(
                 "Physical RIO Inputs",
                 [
                     z["entity_id"]
-                    for z in sorted(collected["prio_zones"], key=lambda x: int(x["zone_number"]))
+                    for z in sorted(collected["prio_zones"], key=itemgetter("zone_number"))
                 ],
                 ),
                 DEVICE_TYPE_PHYSICAL_RIO,
@@ -572,7 +676,7 @@ def _build_entity_cards(
                 "Physical RIO Outputs",
                 [
                     o["entity_id"]
-                    for o in sorted(collected["prio_outputs"], key=lambda x: int(x["output_number"]))
+                    for o in sorted(collected["prio_outputs"], key=itemgetter("output_number"))
                 ],
                 ),
                 DEVICE_TYPE_PHYSICAL_RIO,
@@ -586,7 +690,7 @@ def _build_entity_cards(
                 "Virtual RIO Zones",
                 [
                     z["entity_id"]
-                    for z in sorted(collected["vrio_zones"], key=lambda x: int(x["zone_number"]))
+                    for z in sorted(collected["vrio_zones"], key=itemgetter("zone_number"))
                 ],
                 show_header_toggle=False,
                 ),
@@ -601,7 +705,7 @@ def _build_entity_cards(
                 "Virtual RIO Outputs",
                 [
                     o["entity_id"]
-                    for o in sorted(collected["vrio_outputs"], key=lambda x: int(x["output_number"]))
+                    for o in sorted(collected["vrio_outputs"], key=itemgetter("output_number"))
                 ],
                 ),
                 DEVICE_TYPE_VIRTUAL_RIO,
@@ -615,7 +719,7 @@ def _build_entity_cards(
                 "Groups",
                 [
                     g["entity_id"]
-                    for g in sorted(collected["groups"], key=lambda x: int(x["group_number"]))
+                    for g in sorted(collected["groups"], key=itemgetter("group_number"))
                 ],
                 ),
                 DEVICE_TYPE_GROUPS,
@@ -625,25 +729,26 @@ def _build_entity_cards(
     return cards
 
 
-def _card_by_title(cards: list[dict], title: str) -> dict | None:
-    """Return a card dict by title."""
+def _cards_by_title(cards: list[dict]) -> dict[str | None, dict]:
+    """Index cards by title, keeping the first card for each title."""
+    indexed: dict[str | None, dict] = {}
     for card in cards:
-        if card.get("title") == title:
-            return card
-    return None
+        indexed.setdefault(card.get("title"), card)
+    return indexed
 
 
 def _build_three_column_layout(
     keypad_card: dict, entity_cards: list[dict]
 ) -> dict:
     """Build a full-width keypad row with entity cards in columns below."""
-    log_card = _card_by_title(entity_cards, "Honeywell Galaxy Log")
-    alarm_reporting_card = _card_by_title(entity_cards, "Alarm Reporting Log")
-    zones_card = _card_by_title(entity_cards, "Physical RIO Inputs")
-    outputs_card = _card_by_title(entity_cards, "Physical RIO Outputs")
-    vrio_zones_card = _card_by_title(entity_cards, "Virtual RIO Zones")
-    vrio_outputs_card = _card_by_title(entity_cards, "Virtual RIO Outputs")
-    groups_card = _card_by_title(entity_cards, "Groups")
+    cards_by_title = _cards_by_title(entity_cards)
+    log_card = cards_by_title.get("Honeywell Galaxy Log")
+    alarm_reporting_card = cards_by_title.get("Alarm Reporting Log")
+    zones_card = cards_by_title.get("Physical RIO Inputs")
+    outputs_card = cards_by_title.get("Physical RIO Outputs")
+    vrio_zones_card = cards_by_title.get("Virtual RIO Zones")
+    vrio_outputs_card = cards_by_title.get("Virtual RIO Outputs")
+    groups_card = cards_by_title.get("Groups")
 
     def _column(*cards: dict | None) -> dict:
         return {"type": "vertical-stack", "cards": [c for c in cards if c is not None]}
@@ -1041,22 +1146,20 @@ def _apply_galaxy_layout(
     _merge_layout_into_view(target_view, layout)
 
 
-def _is_galaxy_layout_card(card: dict) -> bool:
+def _is_galaxy_layout_card(card: Any) -> bool:
     """Return True if a card is part of a previous Galaxy dashboard layout."""
+    if not isinstance(card, dict):
+        return False
     if card.get("title") == GALAXY_KEYPAD_TITLE:
         return True
-    if card.get("type") == "custom:stack-in-card":
-        return any(
-            sub.get("name") == "VKPDisplay"
-            for sub in card.get("cards", [])
-            if isinstance(sub, dict)
-        )
-    if card.get("type") in ("horizontal-stack", "vertical-stack", "grid"):
+    card_type = card.get("type")
+    if card_type == "custom:stack-in-card":
         return any(
-            _is_galaxy_layout_card(sub)
-            for sub in card.get("cards", [])
-            if isinstance(sub, dict)
+            isinstance(sub, dict) and sub.get("name") == "VKPDisplay"
+            for sub in card.get("cards", ())
         )
+    if card_type in STACK_CARD_TYPES:
+        return any(_is_galaxy_layout_card(sub) for sub in card.get("cards", ()))
     return False
 
 
@@ -1079,17 +1182,20 @@ async def _resolve_area_dashboard_view(
         )
         return match
 
-    for prefer_id in ("lovelace", None):
-        for dash_id, dashboard, config in loadable:
-            if dash_id != prefer_id:
-                continue
-            view = _ensure_area_view(config, area_id, area_name)
-            _LOGGER.info(
-                "Created area view '%s' on dashboard '%s'",
-                area_name,
-                dash_id or "default",
-            )
-            return dash_id, dashboard, config, view
+    loadable_by_id = {
+        dash_id: (dashboard, config) for dash_id, dashboard, config in loadable
+    }
+    for dash_id in ("lovelace", None):
+        if dash_id not in loadable_by_id:
+            continue
+        dashboard, config = loadable_by_id[dash_id]
+        view = _ensure_area_view(config, area_id, area_name)
+        _LOGGER.info(
+            "Created area view '%s' on dashboard '%s'",
+            area_name,
+            dash_id or "default",
+        )
+        return dash_id, dashboard, config, view
 
     dash_id, dashboard, config = await _get_or_create_galaxy_keypad_dashboard(
         hass, lovelace_data
@@ -1113,19 +1219,23 @@ async def _resolve_area_dashboard_view(
     return None, None, None, None
 
 
-def _card_belongs_to_device(card: dict, device_type: str) -> bool:
-    """Return True if a card was created for a specific integration device."""
-    if card.get("galaxy_card_source") == device_type:
+def _card_belongs_to_devices(
+    card: dict, device_types: frozenset[str], titles: frozenset[str]
+) -> bool:
+    """Return True if a card was created for one of the given integration devices.
+
+    titles holds the DEVICE_TYPE_CARD_TITLES entries for device_types.
+    """
+    if card.get("galaxy_card_source") in device_types:
         return True
-    if device_type == DEVICE_TYPE_VIRTUAL_KEYPAD and _is_galaxy_layout_card(card):
+    if DEVICE_TYPE_VIRTUAL_KEYPAD in device_types and _is_galaxy_layout_card(card):
         return True
-    title = card.get("title")
-    if title and title in DEVICE_TYPE_CARD_TITLES.get(device_type, ()):
+    if card.get("title") in titles:
         return True
-    if card.get("type") in ("vertical-stack", "grid", "horizontal-stack"):
+    if card.get("type") in STACK_CARD_TYPES:
         sub_cards = card.get("cards", [])
         if sub_cards and all(
-            isinstance(sub, dict) and _card_belongs_to_device(sub, device_type)
+            isinstance(sub, dict) and _card_belongs_to_devices(sub, device_types, titles)
             for sub in sub_cards
         ):
             return True
@@ -1133,9 +1243,9 @@ def _card_belongs_to_device(card: dict, device_type: str) -> bool:
 
 
 def _merge_device_cards_into_view(
-    view: dict, cards: list[dict], device_type: str
+    view: dict, device_cards: list[tuple[str, list[dict]]]
 ) -> None:
-    """Replace prior cards for one device type and append the new ones."""
+    """Replace prior cards for the given device types and append the new ones."""
     if _view_uses_sections(view):
         sections = view.setdefault("sections", [])
         if not sections:
@@ -1144,10 +1254,19 @@ def _merge_device_cards_into_view(
     else:
         target_cards = view.setdefault("cards", [])
 
+    device_types = frozenset(device_type for device_type, _ in device_cards)
+    titles = frozenset(
+        title
+        for device_type in device_types
+        for title in DEVICE_TYPE_CARD_TITLES.get(device_type, ())
+    )
     filtered = [
-        card for card in target_cards if not _card_belongs_to_device(card, device_type)
+        card
+        for card in target_cards
+        if not _card_belongs_to_devices(card, device_types, titles)
     ]
-    filtered.extend(cards)
+    for _, cards in device_cards:
+        filtered.extend(cards)
 
     if _view_uses_sections(view):
         sections[0]["cards"] = filtered
@@ -1184,7 +1303,7 @@ async def _build_device_cards(
         entities = collected["entities"]
         if not entities.get("display_line1") or not entities.get("display_line2"):
             return []
-        keypad_card = await _load_keypad_card(
+        keypad_card = _load_keypad_card(
             entry, entities["display_line1"], entities["display_line2"]
         )
         if keypad_card is None:
@@ -1248,26 +1367,29 @@ async def _try_add_cards_for_assigned_devices(
         if (device_type := get_device_type(device)) is not None
     }
     entity_registry = er.async_get(hass)
-    collections: dict[str, dict[str, Any]] = {}
+    # One registry pass per poll covers every assigned device type; card
+    # builders only read the collection keys for their own type
+    assigned_kinds = frozenset().union(
+        *(
+            DEVICE_TYPE_ENTITY_KINDS.get(device_type, ())
+            for device_type in assigned_types
+        )
+    )
+    collected = _collect_entities_for_kinds(
+        entity_registry, entry.entry_id, assigned_kinds
+    )
 
     for second in range(wait_timeout):
-        collections = {
-            device_type: _collect_entities_for_device_type(
-                entity_registry, entry.entry_id, device_type
-            )
+        ready = [
+            _device_collection_ready(collected, device_type)
             for device_type in assigned_types
-        }
-        if all(
-            _device_collection_ready(collections[device_type], device_type)
-            for device_type in assigned_types
-        ):
-            break
-        if second >= 30 and any(
-            _device_collection_ready(collections[device_type], device_type)
-            for device_type in assigned_types
-        ):
+        ]
+        if all(ready) or (second >= 30 and any(ready)):
             break
         await asyncio.sleep(1)
+        collected = _collect_entities_for_kinds(
+            entity_registry, entry.entry_id, assigned_kinds
+        )
 
     pending: list[tuple[dr.DeviceEntry, str, list[dict]]] = []
     for device in devices:
@@ -1275,12 +1397,9 @@ async def _try_add_cards_for_assigned_devices(
         if device_type is None:
             continue
 
-        collected = collections.get(device_type) or _collect_entities_for_device_type(
-            entity_registry, entry.entry_id, device_type
-        )
         cards = await _build_device_cards(hass, entry, device_type, collected)
         if not cards:
-            _LOGGER.warning(
+            _LOGGER.debug(
                 "No cards built yet for %s (%s)", device.name, device_type
             )
             continue
@@ -1333,8 +1452,7 @@ async def _try_add_cards_for_assigned_devices(
             )
             continue
 
-        for device_type, cards in area_cards:
-            _merge_device_cards_into_view(target_view, cards, device_type)
+        _merge_device_cards_into_view(target_view, area_cards)
 
         if dash_id and _is_dedicated_galaxy_dashboard(dash_id):
             _remove_dedicated_galaxy_view(config)
@@ -1354,8 +1472,6 @@ async def _try_add_cards_for_assigned_devices(
         resources_ok = await _ensure_lovelace_resources(hass)
         if keypad_has_area:
             if saved:
-                from homeassistant.components import persistent_notification
-
                 keypad_area_name = next(
                     (
                         _area_name(hass, device.area_id)
@@ -1388,8 +1504,6 @@ async def _try_add_cards_for_assigned_devices(
                 )
         elif await _save_keypad_to_galaxy_dashboard(hass, lovelace, keypad_card):
             saved = True
-            from homeassistant.components import persistent_notification
-
             resource_hint = ""
             if not resources_ok:
                 resource_hint = (
@@ -1428,7 +1542,7 @@ async def _try_add_full_dashboard(
         )
         return False
 
-    keypad_card = await _load_keypad_card(
+    keypad_card = _load_keypad_card(
         entry, entities["display_line1"], entities["display_line2"]
     )
     if keypad_card is None:
@@ -1471,8 +1585,6 @@ async def _try_add_full_dashboard(
             "from HACS. Add them under Settings → Dashboards → Resources if needed."
         )
 
-    from homeassistant.components import persistent_notification
-
     persistent_notification.async_create(
         hass,
         (
@@ -1501,14 +1613,16 @@ def _merge_layout_into_view(view: dict, layout: dict) -> None:
         first_section = sections[0]
         cards = first_section.setdefault("cards", [])
         first_section["cards"] = [
-            card for card in cards if not _is_galaxy_layout_card(card)
+            layout,
+            *(card for card in cards if not _is_galaxy_layout_card(card)),
         ]
-        first_section["cards"].insert(0, layout)
         return
 
     cards = view.setdefault("cards", [])
-    view["cards"] = [card for card in cards if not _is_galaxy_layout_card(card)]
-    view["cards"].insert(0, layout)
+    view["cards"] = [
+        layout,
+        *(card for card in cards if not _is_galaxy_layout_card(card)),
+    ]
 
 
 @callback
@@ -1525,7 +1639,7 @@ def schedule_add_cards(
     @callback
     def _run(_now) -> None:
         _card_schedule_handles.pop(entry_id, None)
-        hass.async_create_task(auto_add_cards(hass, entry, delay_seconds=0))
+        hass.async_create_task(auto_add_cards(hass, entry, wait_seconds=0))
 
     _card_schedule_handles[entry_id] = async_call_later(hass, delay_seconds, _run)
 
@@ -1533,14 +1647,20 @@ def schedule_add_cards(
 async def auto_add_cards(
     hass: HomeAssistant,
     entry: ConfigEntry,
-    delay_seconds: int = DEFAULT_CARD_SETUP_DELAY,
+    wait_seconds: int = DEFAULT_CARD_SETUP_WAIT,
     *,
     full_dashboard: bool = False,
 ) -> None:
-    """Add Galaxy Lovelace cards for assigned devices."""
-    if delay_seconds:
-        _LOGGER.info("Galaxy dashboard cards scheduled in %s seconds", delay_seconds)
-        await asyncio.sleep(delay_seconds)
+    """Add Galaxy Lovelace cards for assigned devices.
+
+    Waits up to wait_seconds for the keypad display entities to register.
+    """
+    if wait_seconds:
+        _LOGGER.info(
+            "Galaxy dashboard cards waiting up to %s seconds for entities",
+            wait_seconds,
+        )
+        await _wait_for_keypad_display_entities(hass, entry.entry_id, wait_seconds)
 
     try:
         for attempt, retry_delay in enumerate(CARD_SETUP_RETRIES):
@@ -3,12 +3,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 
 from .const import (
+    DISCOVERED_OPTION_PREFIX,
     DISCOVERY_IDLE_SECONDS,
     DISCOVERY_MAX_SECONDS,
-    DISCOVERY_POLL_INTERVAL,
     MQTT_CONNECT_MAX_SECONDS,
 )
 from .coordinator import GalaxyCoordinator
@@ -18,36 +20,21 @@ _LOGGER = logging.getLogger(__name__)
 
 async def wait_for_mqtt_connected(coordinator: GalaxyCoordinator) -> bool:
     """Wait briefly for the coordinator MQTT client to connect."""
-    if coordinator.connected:
+    if coordinator.connected_event.is_set():
         return True
 
     _LOGGER.debug("MQTT not connected yet, waiting up to %ss", MQTT_CONNECT_MAX_SECONDS)
-    for _ in range(MQTT_CONNECT_MAX_SECONDS):
-        await asyncio.sleep(1)
-        if coordinator.connected:
-            return True
-
-    _LOGGER.error(
-        "MQTT not connected after %s seconds, skipping discovery",
-        MQTT_CONNECT_MAX_SECONDS,
-    )
-    return False
-
-
-async def _wait_for_discovery_idle(
-    *,
-    has_items: Callable[[], bool],
-    last_activity: Callable[[], float],
-) -> None:
-    """Stop once discovery goes quiet or the max wait is reached."""
-    loop = asyncio.get_running_loop()
-    started = loop.time()
-    deadline = started + DISCOVERY_MAX_SECONDS
-
-    while loop.time() < deadline:
-        if has_items() and (loop.time() - last_activity()) >= DISCOVERY_IDLE_SECONDS:
-            return
-        await asyncio.sleep(DISCOVERY_POLL_INTERVAL)
+    try:
+        await asyncio.wait_for(
+            coordinator.connected_event.wait(), MQTT_CONNECT_MAX_SECONDS
+        )
+    except TimeoutError:
+        _LOGGER.error(
+            "MQTT not connected after %s seconds, skipping discovery",
+            MQTT_CONNECT_MAX_SECONDS,
+        )
+        return False
+    return True
 
 
 async def discover_mqtt_numeric_ids(
@@ -56,22 +43,34 @@ async def discover_mqtt_numeric_ids(
     *,
     label: str,
 ) -> set[int]:
-    """Discover numeric IDs published under an MQTT wildcard topic."""
+    """Discover numeric IDs published under an MQTT wildcard topic.
+
+    Discovery ends once no new ID has arrived for DISCOVERY_IDLE_SECONDS,
+    or after DISCOVERY_MAX_SECONDS when the topic stays silent.
+    """
     discovered: set[int] = set()
     loop = asyncio.get_running_loop()
-    activity = {"at": loop.time()}
+    idle = asyncio.Event()
+    idle_timer: asyncio.TimerHandle | None = None
 
+    @callback
     def discovery_handler(topic: str, payload: str) -> None:
         try:
-            item_id = int(topic.split("/")[-1])
+            item_id = int(topic.rpartition("/")[2])
         except (ValueError, IndexError):
             _LOGGER.debug("Could not parse %s from topic %s", label, topic)
             return
 
-        if item_id not in discovered:
-            _LOGGER.debug("Discovered %s %s (value: %s)", label, item_id, payload)
+        if item_id in discovered:
+            # Repeated updates for a known ID must not hold discovery open
+            return
+        _LOGGER.debug("Discovered %s %s (value: %s)", label, item_id, payload)
         discovered.add(item_id)
-        activity["at"] = loop.time()
+
+        nonlocal idle_timer
+        if idle_timer is not None:
+            idle_timer.cancel()
+        idle_timer = loop.call_later(DISCOVERY_IDLE_SECONDS, idle.set)
 
     if not await wait_for_mqtt_connected(coordinator):
         return discovered
@@ -79,16 +78,51 @@ async def discover_mqtt_numeric_ids(
     _LOGGER.debug("Subscribing to discovery topic: %s", discovery_topic)
     coordinator.subscribe(discovery_topic, discovery_handler)
     try:
-        await _wait_for_discovery_idle(
-            has_items=lambda: bool(discovered),
-            last_activity=lambda: activity["at"],
+        await asyncio.wait_for(idle.wait(), DISCOVERY_MAX_SECONDS)
+    except TimeoutError:
+        _LOGGER.debug(
+            "Discovery on %s reached the %ss limit",
+            discovery_topic,
+            DISCOVERY_MAX_SECONDS,
         )
     finally:
         coordinator.unsubscribe(discovery_topic, discovery_handler)
+        if idle_timer is not None:
+            idle_timer.cancel()
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Discovery complete for %s: found %s",
+            discovery_topic,
+            sorted(discovered),
+        )
+    return discovered
+
 
-    _LOGGER.info(
-        "Discovery complete for %s: found %s",
-        discovery_topic,
-        sorted(discovered),
+async def discover_cached_numeric_ids(
+    coordinator: GalaxyCoordinator,
+    entry: ConfigEntry,
+    source: str,
+    discovery_topic: str,
+    *,
+    label: str,
+) -> set[int]:
+    """Return IDs discovered on a previous start, discovering them if needed.
+
+    Non-empty results are stored in the entry options under
+    DISCOVERED_OPTION_PREFIX + source so later restarts skip the MQTT scan.
+    """
+    option_key = f"{DISCOVERED_OPTION_PREFIX}{source}"
+    cached = entry.options.get(option_key)
+    if cached is not None:
+        _LOGGER.debug("Using cached %s IDs: %s", label, cached)
+        return set(cached)
+
+    discovered = await discover_mqtt_numeric_ids(
+        coordinator, discovery_topic, label=label
     )
+    if discovered:
+        coordinator.hass.config_entries.async_update_entry(
+            entry, options={**entry.options, option_key: sorted(discovered)}
+        )
     return discovered
@@ -1,12 +1,14 @@
 """Support for Honeywell Galaxy sensors."""
 from __future__ import annotations
 
+from collections import deque
+from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -19,7 +21,7 @@ from .device import (
     virtual_keypad_device_info,
     virtual_printer_device_info,
 )
-from .mqtt_discovery import discover_mqtt_numeric_ids
+from .mqtt_discovery import discover_cached_numeric_ids
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,15 +41,14 @@ class _LogLineBuffer:
     """Rolling buffer of log lines for printer-style MQTT text sensors."""
 
     def __init__(self, max_lines: int = LOG_LINE_MAX) -> None:
-        self._log_lines: list[str] = []
+        self._log_lines: deque[str] = deque(maxlen=max_lines)
         self._max_lines = max_lines
         self._state = ""
+        self._attributes = self._build_attributes()
 
     def append(self, message: str) -> None:
         """Append a line and refresh the truncated state value."""
         self._log_lines.append(message)
-        if len(self._log_lines) > self._max_lines:
-            self._log_lines = self._log_lines[-self._max_lines :]
 
         full_log = "\n".join(self._log_lines)
         if len(full_log) > 255:
@@ -61,6 +62,16 @@ class _LogLineBuffer:
         if len(self._state) > 255:
             self._state = self._state[:252] + "..."
 
+        self._attributes = self._build_attributes()
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Snapshot the log buffer attributes after an update."""
+        return {
+            "log_lines": tuple(self._log_lines),
+            "line_count": len(self._log_lines),
+            "max_lines": self._max_lines,
+        }
+
     @property
     def state(self) -> str:
         """Return the sensor state, truncated for HA limits."""
@@ -71,11 +82,7 @@ class _LogLineBuffer:
     @property
     def extra_attributes(self) -> dict[str, Any]:
         """Return log buffer attributes for Lovelace cards."""
-        return {
-            "log_lines": self._log_lines.copy(),
-            "line_count": len(self._log_lines),
-            "max_lines": self._max_lines,
-        }
+        return self._attributes
 
 KEYPAD_SENSORS = [
     SensorEntityDescription(
@@ -90,6 +97,9 @@ KEYPAD_SENSORS = [
     ),
 ]
 
+# Keypad display sensor key -> display topic suffix
+DISPLAY_SUFFIX = {"display_line1": "line1", "display_line2": "line2"}
+
 PRINTER_SENSOR = SensorEntityDescription(
     key="printer_log",
     name="Printer Log",
@@ -112,23 +122,28 @@ async def async_setup_entry(
     coordinator: GalaxyCoordinator = hass.data[DOMAIN][entry.entry_id]
     vmodid = entry.data.get("vmodid", "")
 
+    vkp_topic = TOPIC_VKP.format(vmodid=vmodid)
+    groups_topic = TOPIC_SIA4_GROUPS.format(vmodid=vmodid)
+
     entities = []
 
     for description in KEYPAD_SENSORS:
-        entities.append(KeypadDisplaySensor(coordinator, entry, vmodid, description))
+        entities.append(KeypadDisplaySensor(coordinator, entry, vkp_topic, description))
 
     entities.append(PrinterLogSensor(coordinator, entry, vmodid))
     entities.append(AlarmReportingLogSensor(coordinator, entry, vmodid))
 
     _LOGGER.info("Discovering groups from MQTT topics...")
-    discovered_groups = await discover_mqtt_numeric_ids(
+    discovered_groups = await discover_cached_numeric_ids(
         coordinator,
-        f"{TOPIC_SIA4_GROUPS.format(vmodid=vmodid)}/+",
+        entry,
+        "groups",
+        f"{groups_topic}/+",
         label="group",
     )
-    _LOGGER.info("Discovered %s groups: %s", len(discovered_groups), sorted(discovered_groups))
+    _LOGGER.info("Discovered %s groups", len(discovered_groups))
     for group_num in discovered_groups:
-        entities.append(GroupSensor(coordinator, entry, vmodid, group_num))
+        entities.append(GroupSensor(coordinator, entry, groups_topic, group_num))
 
     async_add_entities(entities)
 
@@ -140,45 +155,38 @@ class KeypadDisplaySensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        topic_prefix: str,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._description = description
-        self._vkp_topic = TOPIC_VKP.format(vmodid=vmodid)
+        self._topic = f"{topic_prefix}/display/{DISPLAY_SUFFIX[description.key]}"
         self._state = ""
 
-        self._attr_unique_id = f"{entry.entry_id}_keypad_{description.key}"
+        self._attr_unique_id = f"{self._entry_id}_keypad_{description.key}"
         self._attr_name = description.name
         self._attr_device_info = virtual_keypad_device_info(entry)
         self.entity_description = description
 
-    async def _async_update_state(self, payload: str) -> None:
-        """Update state in the event loop."""
+    @callback
+    def _handle_message(self, topic: str, payload: str) -> None:
+        """Handle message updates from MQTT."""
         self._state = payload
         self.async_write_ha_state()
-        _LOGGER.debug(f"Updated state for {self._description.key} to: {self._state}")
+        _LOGGER.debug("Updated state for %s to: %s", self._description.key, self._state)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to MQTT topics when added to hass."""
         await super().async_added_to_hass()
 
-        topic = f"{self._vkp_topic}/display/{self._description.key.replace('display_', '')}"
-        _LOGGER.info(f"Subscribing to display topic: {topic}")
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            _LOGGER.debug(f"Received display update for {self._description.key}: {payload}")
-            # Schedule the state update to run in the Home Assistant event loop
-            self.hass.loop.call_soon_threadsafe(
-                lambda p=payload: self.hass.async_create_task(self._async_update_state(p))
-            )
-
-        self.coordinator.subscribe(topic, handle_message)
-        _LOGGER.debug(f"Subscription registered for {topic}")
+        _LOGGER.info("Subscribing to display topic: %s", self._topic)
+        self.coordinator.subscribe(self._topic, self._handle_message)
+        self.async_on_remove(
+            partial(self.coordinator.unsubscribe, self._topic, self._handle_message)
+        )
+        _LOGGER.debug("Subscription registered for %s", self._topic)
 
     @property
     def native_value(self) -> str:
@@ -194,19 +202,19 @@ class PrinterLogSensor(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
-        self._vprinter_topic = TOPIC_VPRINTER.format(vmodid=vmodid)
+        self._entry_id = entry.entry_id
+        self._topic = f"{TOPIC_VPRINTER.format(vmodid=vmodid)}/log"
         self._buffer = _LogLineBuffer()
 
-        self._attr_unique_id = f"{entry.entry_id}_printer_log"
+        self._attr_unique_id = f"{self._entry_id}_printer_log"
         self._attr_name = PRINTER_SENSOR.name
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_device_info = virtual_printer_device_info(entry)
         self.entity_description = PRINTER_SENSOR
 
-    async def _async_update_state(self, payload: str) -> None:
-        """Update state in the event loop - add new line to log buffer."""
+    @callback
+    def _handle_message(self, topic: str, payload: str) -> None:
+        """Handle message updates from MQTT - add new line to log buffer."""
         message = payload.strip()
         if not message:
             return
@@ -221,18 +229,12 @@ class PrinterLogSensor(CoordinatorEntity, SensorEntity):
         """Subscribe to MQTT topics when added to hass."""
         await super().async_added_to_hass()
 
-        topic = f"{self._vprinter_topic}/log"
-        _LOGGER.info(f"Subscribing to printer log topic: {topic}")
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            _LOGGER.debug(f"Received printer log message: {payload}")
-            self.hass.loop.call_soon_threadsafe(
-                lambda p=payload: self.hass.async_create_task(self._async_update_state(p))
-            )
-
-        self.coordinator.subscribe(topic, handle_message)
-        _LOGGER.debug(f"Subscription registered for {topic}")
+        _LOGGER.info("Subscribing to printer log topic: %s", self._topic)
+        self.coordinator.subscribe(self._topic, self._handle_message)
+        self.async_on_remove(
+            partial(self.coordinator.unsubscribe, self._topic, self._handle_message)
+        )
+        _LOGGER.debug("Subscription registered for %s", self._topic)
 
     @property
     def native_value(self) -> str:
@@ -253,19 +255,19 @@ class AlarmReportingLogSensor(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._event_topic = TOPIC_SIA4_EVENT.format(vmodid=vmodid)
         self._buffer = _LogLineBuffer()
 
-        self._attr_unique_id = f"{entry.entry_id}_alarm_reporting_log"
+        self._attr_unique_id = f"{self._entry_id}_alarm_reporting_log"
         self._attr_name = ALARM_REPORTING_SENSOR.name
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_device_info = alarm_reporting_device_info(entry)
         self.entity_description = ALARM_REPORTING_SENSOR
 
-    async def _async_update_state(self, payload: str) -> None:
-        """Update state in the event loop - add new alarm report line."""
+    @callback
+    def _handle_message(self, topic: str, payload: str) -> None:
+        """Handle message updates from MQTT - add new alarm report line."""
         message = format_alarm_reporting_message(payload)
         if message is None:
             return
@@ -281,15 +283,10 @@ class AlarmReportingLogSensor(CoordinatorEntity, SensorEntity):
         await super().async_added_to_hass()
 
         _LOGGER.info("Subscribing to alarm reporting topic: %s", self._event_topic)
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            _LOGGER.debug("Received alarm reporting message: %s", payload)
-            self.hass.loop.call_soon_threadsafe(
-                lambda p=payload: self.hass.async_create_task(self._async_update_state(p))
-            )
-
-        self.coordinator.subscribe(self._event_topic, handle_message)
+        self.coordinator.subscribe(self._event_topic, self._handle_message)
+        self.async_on_remove(
+            partial(self.coordinator.unsubscribe, self._event_topic, self._handle_message)
+        )
 
     @property
     def native_value(self) -> str:
@@ -309,43 +306,41 @@ class GroupSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        topic_prefix: str,
         group_number: int,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._group_number = group_number
-        self._groups_topic = TOPIC_SIA4_GROUPS.format(vmodid=vmodid)
+        self._topic = f"{topic_prefix}/{group_number}"
         self._state = ""
 
-        self._attr_unique_id = f"{entry.entry_id}_group_{group_number}"
+        self._attr_unique_id = f"{self._entry_id}_group_{group_number}"
         self._attr_name = f"Group {group_number}"
         self._attr_device_info = groups_device_info(entry)
 
-    async def _async_update_state(self, payload: str) -> None:
-        """Update state in the event loop."""
+    @callback
+    def _handle_message(self, topic: str, payload: str) -> None:
+        """Handle message updates from MQTT."""
         self._state = payload.strip()
         self.async_write_ha_state()
-        _LOGGER.debug(f"Updated state for Group {self._group_number} to: {self._state}")
+        _LOGGER.debug(
+            "Updated state for Group %s to: %s",
+            self._group_number,
+            self._state,
+        )
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to MQTT topics when added to hass."""
         await super().async_added_to_hass()
 
-        topic = f"{self._groups_topic}/{self._group_number}"
-        _LOGGER.info(f"Subscribing to group topic: {topic}")
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            _LOGGER.debug(f"Received group update for Group {self._group_number}: {payload}")
-            self.hass.loop.call_soon_threadsafe(
-                lambda p=payload: self.hass.async_create_task(self._async_update_state(p))
-            )
-
-        self.coordinator.subscribe(topic, handle_message)
-        _LOGGER.debug(f"Subscription registered for {topic}")
+        _LOGGER.info("Subscribing to group topic: %s", self._topic)
+        self.coordinator.subscribe(self._topic, self._handle_message)
+        self.async_on_remove(
+            partial(self.coordinator.unsubscribe, self._topic, self._handle_message)
+        )
+        _LOGGER.debug("Subscription registered for %s", self._topic)
 
     @property
     def native_value(self) -> str:
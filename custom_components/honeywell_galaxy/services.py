@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
 
-from .const import DOMAIN, TOPIC_VPRINTER
+from .const import DISCOVERED_OPTION_PREFIX, DOMAIN, TOPIC_VPRINTER
+from .coordinator import GalaxyCoordinator
 from .lovelace import auto_add_cards
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,6 +16,7 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_PRINT_TEXT = "print_text"
 SERVICE_TEST_MQTT = "test_mqtt"
 SERVICE_ADD_DASHBOARD_CARDS = "add_dashboard_cards"
+SERVICE_REDISCOVER = "rediscover"
 
 SERVICE_PRINT_TEXT_SCHEMA = vol.Schema(
     {
@@ -31,25 +33,31 @@ SERVICE_TEST_MQTT_SCHEMA = vol.Schema(
 
 SERVICE_ADD_DASHBOARD_CARDS_SCHEMA = vol.Schema({})
 
+SERVICE_REDISCOVER_SCHEMA = vol.Schema({})
+
+
+@callback
+def _first_coordinator(hass: HomeAssistant) -> GalaxyCoordinator | None:
+    """Return the coordinator of the first loaded entry, if any."""
+    return next(iter(hass.data.get(DOMAIN, {}).values()), None)
+
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Honeywell Galaxy."""
 
     async def print_text(call: ServiceCall) -> None:
         """Print text to virtual printer."""
-        text = call.data.get("text", "")
+        text = call.data["text"]
         if not text:
             _LOGGER.error("No text provided for print_text service")
             return
 
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
             _LOGGER.error("No Honeywell Galaxy integration configured")
             return
 
-        entry = entries[0]
-        coordinator = hass.data[DOMAIN][entry.entry_id]
-        vmodid = entry.data.get("vmodid", "")
+        vmodid = coordinator.entry.data.get("vmodid", "")
 
         topic = f"{TOPIC_VPRINTER.format(vmodid=vmodid)}/print"
         coordinator.publish(topic, text)
@@ -57,21 +65,18 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     async def test_mqtt(call: ServiceCall) -> None:
         """Test MQTT publishing."""
-        topic = call.data.get("topic", "")
-        payload = call.data.get("payload", "")
+        topic = call.data["topic"]
+        payload = call.data["payload"]
 
         if not topic or not payload:
             _LOGGER.error("Topic and payload are required for test_mqtt service")
             return
 
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
             _LOGGER.error("No Honeywell Galaxy integration configured")
             return
 
-        entry = entries[0]
-        coordinator = hass.data[DOMAIN][entry.entry_id]
-
         _LOGGER.info(
             "Testing MQTT publish: topic=%s, payload=%s, connected=%s",
             topic,
@@ -89,7 +94,24 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             return
 
         for entry in entries:
-            await auto_add_cards(hass, entry, delay_seconds=0, full_dashboard=True)
+            await auto_add_cards(hass, entry, wait_seconds=0, full_dashboard=True)
+
+    async def rediscover(call: ServiceCall) -> None:
+        """Forget cached discovery results and reload to scan MQTT again."""
+        entries = hass.config_entries.async_entries(DOMAIN)
+        if not entries:
+            _LOGGER.error("No Honeywell Galaxy integration configured")
+            return
+
+        for entry in entries:
+            options = {
+                key: value
+                for key, value in entry.options.items()
+                if not key.startswith(DISCOVERED_OPTION_PREFIX)
+            }
+            hass.config_entries.async_update_entry(entry, options=options)
+            _LOGGER.info("Cleared cached discovery for %s, reloading", entry.title)
+            await hass.config_entries.async_reload(entry.entry_id)
 
     hass.services.async_register(
         DOMAIN, SERVICE_PRINT_TEXT, print_text, schema=SERVICE_PRINT_TEXT_SCHEMA
@@ -103,6 +125,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         add_dashboard_cards,
         schema=SERVICE_ADD_DASHBOARD_CARDS_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REDISCOVER, rediscover, schema=SERVICE_REDISCOVER_SCHEMA
+    )
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
@@ -110,3 +135,4 @@ async def async_unload_services(hass: HomeAssistant) -> None:
     hass.services.async_remove(DOMAIN, SERVICE_PRINT_TEXT)
     hass.services.async_remove(DOMAIN, SERVICE_TEST_MQTT)
     hass.services.async_remove(DOMAIN, SERVICE_ADD_DASHBOARD_CARDS)
+    hass.services.async_remove(DOMAIN, SERVICE_REDISCOVER)
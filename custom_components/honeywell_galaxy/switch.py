@@ -10,13 +10,15 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, TOPIC_VRIO_INPUTS, TOPIC_VRIO_INPUTS_READ
+from .const import DOMAIN, OPEN_PAYLOADS, TOPIC_VRIO_INPUTS, TOPIC_VRIO_INPUTS_READ
 from .coordinator import GalaxyCoordinator
 from .device import virtual_rio_device_info
-from .mqtt_discovery import discover_mqtt_numeric_ids
+from .mqtt_discovery import discover_cached_numeric_ids
 
 _LOGGER = logging.getLogger(__name__)
 
+_EMPTY: tuple = ()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,36 +28,37 @@ async def async_setup_entry(
     """Set up the Honeywell Galaxy Virtual RIO Zones."""
     coordinator: GalaxyCoordinator = hass.data[DOMAIN][entry.entry_id]
     vmodid = entry.data.get("vmodid", "")
+    write_topic = TOPIC_VRIO_INPUTS.format(vmodid=vmodid)
+    read_topic = TOPIC_VRIO_INPUTS_READ.format(vmodid=vmodid)
 
-    entities = []
+    zones = entry.options.get("virtual_rio_zones", _EMPTY)
 
-    zones = entry.options.get("virtual_rio_zones", [])
-    
     if not zones:
         _LOGGER.info("No Virtual RIO zones configured. Discovering zones from MQTT topics...")
-        discovered_zones = await discover_mqtt_numeric_ids(
+        discovered_zones = await discover_cached_numeric_ids(
             coordinator,
-            f"{TOPIC_VRIO_INPUTS_READ.format(vmodid=vmodid)}/+",
+            entry,
+            "virtual_rio_zones",
+            f"{read_topic}/+",
             label="Virtual RIO zone",
         )
-        _LOGGER.info(
-            "Discovered %s Virtual RIO zones: %s",
-            len(discovered_zones),
-            sorted(discovered_zones),
-        )
-        for zone_num in discovered_zones:
-            entities.append(
-                VirtualRIOZone(
-                    coordinator, entry, vmodid, zone_num, None
-                )
-            )
+        _LOGGER.info("Discovered %s Virtual RIO zones", len(discovered_zones))
+        entities = [
+            VirtualRIOZone(coordinator, entry, write_topic, read_topic, zone_num)
+            for zone_num in discovered_zones
+        ]
     else:
-        for zone_config in zones:
-            entities.append(
-                VirtualRIOZone(
-                    coordinator, entry, vmodid, zone_config.get("zone_number"), zone_config.get("name")
-                )
+        entities = [
+            VirtualRIOZone(
+                coordinator,
+                entry,
+                write_topic,
+                read_topic,
+                zone_config.get("zone_number"),
+                zone_config.get("name"),
             )
+            for zone_config in zones
+        ]
 
     if not entities:
         _LOGGER.warning("No Virtual RIO Zones configured. Add zones via integration options.")
@@ -66,29 +69,31 @@ async def async_setup_entry(
 class VirtualRIOZone(CoordinatorEntity, SwitchEntity):
     """Representation of a Virtual RIO Zone."""
 
+    _ON_PAYLOADS = OPEN_PAYLOADS
+
     def __init__(
         self,
         coordinator: GalaxyCoordinator,
         entry: ConfigEntry,
-        vmodid: str,
+        write_topic_prefix: str,
+        read_topic_prefix: str,
         zone_number: int,
         name: str | None = None,
     ) -> None:
         """Initialize the Virtual RIO Zone."""
         super().__init__(coordinator)
-        self._entry = entry
-        self._vmodid = vmodid
+        self._entry_id = entry.entry_id
         self._zone_number = zone_number
-        self._vrio_write_topic = TOPIC_VRIO_INPUTS.format(vmodid=vmodid)
-        self._vrio_read_topic = TOPIC_VRIO_INPUTS_READ.format(vmodid=vmodid)
-        self._is_on = False
+        self._write_topic = f"{write_topic_prefix}/{zone_number}"
+        self._read_topic = f"{read_topic_prefix}/{zone_number}"
+        self._is_on: bool | None = None
 
-        self._attr_unique_id = f"{entry.entry_id}_vrio_zone_{zone_number}"
+        self._attr_unique_id = f"{self._entry_id}_vrio_zone_{zone_number}"
         self._attr_name = name or f"Zone {zone_number}"
         self._attr_device_info = virtual_rio_device_info(entry)
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return true if the zone is open."""
         return self._is_on
 
@@ -100,32 +105,25 @@ class VirtualRIOZone(CoordinatorEntity, SwitchEntity):
         """Turn the zone off (CLOSED)."""
         await self._set_zone_state(False)
 
-    async def _async_update_state(self, is_on: bool) -> None:
+    @callback
+    def _sync_update_state(self, is_on: bool) -> None:
         """Update state in the event loop."""
+        if is_on == self._is_on:
+            return
         self._is_on = is_on
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT topics when added to hass."""
+        """Route MQTT updates for this zone's read topic while it is added."""
         await super().async_added_to_hass()
-
-        read_topic = f"{self._vrio_read_topic}/{self._zone_number}"
-
-        def handle_message(topic: str, payload: str) -> None:
-            """Handle message updates from MQTT thread."""
-            payload_upper = payload.strip().upper()
-            is_on = payload_upper == "OPEN"
-            self.hass.loop.call_soon_threadsafe(
-                lambda state=is_on: self.hass.async_create_task(self._async_update_state(state))
-            )
-
-        self.coordinator.subscribe(read_topic, handle_message)
+        self.async_on_remove(
+            self.coordinator.async_add_route(self._read_topic, self)
+        )
 
     async def _set_zone_state(self, state: bool) -> None:
         """Set zone state via MQTT."""
-        topic = f"{self._vrio_write_topic}/{self._zone_number}"
         payload = "OPEN" if state else "CLOSED"
-        self.coordinator.publish(topic, payload)
+        self.coordinator.publish(self._write_topic, payload)
         self._is_on = state
         self.async_write_ha_state()
-        _LOGGER.debug(f"Set zone {self._zone_number} to {payload}")
+        _LOGGER.debug("Set zone %s to %s", self._zone_number, payload)
@@ -0,0 +1,103 @@
+"""MQTT topic filter trie for wildcard subscription matching."""
+from __future__ import annotations
+
+from typing import Callable, Iterator
+
+TopicCallbacks = dict[Callable[[str, str], None], None]
+
+
+def is_wildcard_filter(topic_filter: str) -> bool:
+    """Return True if a topic filter contains + or # wildcards."""
+    return "+" in topic_filter or "#" in topic_filter
+
+
+class _TrieNode:
+    """One topic level in the trie."""
+
+    __slots__ = ("children", "subscription")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, _TrieNode] = {}
+        self.subscription: tuple[str, TopicCallbacks] | None = None
+
+
+class TopicTrie:
+    """Topic filters stored per level, with + and # as ordinary child keys.
+
+    Matching a topic descends one level per topic segment, following the
+    literal child and the + child and collecting any # child on the way, so
+    the cost depends on the topic depth rather than the number of filters.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root = _TrieNode()
+
+    def __bool__(self) -> bool:
+        """Return True if any topic filter is stored."""
+        return bool(self._root.children)
+
+    def insert(self, topic_filter: str, callbacks: TopicCallbacks) -> None:
+        """Store the callback list for a topic filter."""
+        node = self._root
+        for part in topic_filter.split("/"):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+        node.subscription = (topic_filter, callbacks)
+
+    def remove(self, topic_filter: str) -> None:
+        """Remove a topic filter and prune any branches left empty."""
+        path = [self._root]
+        for part in topic_filter.split("/"):
+            child = path[-1].children.get(part)
+            if child is None:
+                return
+            path.append(child)
+
+        path[-1].subscription = None
+        for parent, part, node in zip(
+            reversed(path[:-1]),
+            reversed(topic_filter.split("/")),
+            reversed(path[1:]),
+            strict=True,
+        ):
+            if node.children or node.subscription is not None:
+                break
+            del parent.children[part]
+
+    def iter_matches(
+        self, topic_parts: list[str]
+    ) -> Iterator[tuple[str, TopicCallbacks]]:
+        """Yield (topic filter, callbacks) for every filter matching a topic."""
+        # Wildcards must not match $-prefixed topics such as $SYS
+        system_topic = topic_parts[0][:1] == "$"
+        nodes = [self._root]
+        for level, part in enumerate(topic_parts):
+            wildcards = not (system_topic and level == 0)
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if wildcards:
+                    multi = children.get("#")
+                    if multi is not None and multi.subscription is not None:
+                        yield multi.subscription
+                    single = children.get("+")
+                    if single is not None:
+                        next_nodes.append(single)
+                literal = children.get(part)
+                if literal is not None:
+                    next_nodes.append(literal)
+            if not next_nodes:
+                return
+            nodes = next_nodes
+
+        for node in nodes:
+            if node.subscription is not None:
+                yield node.subscription
+            # "a/#" also matches "a" itself
+            multi = node.children.get("#")
+            if multi is not None and multi.subscription is not None:
+                yield multi.subscription
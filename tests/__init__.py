@@ -0,0 +1 @@
+"""Tests for the Honeywell Galaxy integration."""
@@ -0,0 +1,66 @@
+"""Tests for the Honeywell Galaxy MQTT coordinator."""
+from __future__ import annotations
+
+import socket
+import ssl
+from unittest.mock import MagicMock
+
+from paho.mqtt.client import MQTT_ERR_CONN_LOST, MQTT_ERR_SUCCESS
+
+from custom_components.honeywell_galaxy.coordinator import _loop_read
+
+
+class _BufferedTLSSocket(ssl.SSLSocket):
+    """TLS socket whose decrypted buffer still holds unread MQTT packets."""
+
+    def __init__(self, packets: int) -> None:
+        """Hold packets decrypted from one TLS record; no real connection."""
+        self.packets = packets
+
+    def pending(self) -> int:
+        """Return how many buffered packets remain."""
+        return self.packets
+
+
+def _client_reading(sock: _BufferedTLSSocket) -> MagicMock:
+    """Return a client whose loop_read consumes one buffered packet per call."""
+    client = MagicMock()
+
+    def loop_read() -> int:
+        sock.packets -= 1
+        return MQTT_ERR_SUCCESS
+
+    client.loop_read.side_effect = loop_read
+    return client
+
+
+def test_loop_read_drains_multi_packet_tls_record() -> None:
+    """SUBACK plus five retained PUBLISHes in one record are all read."""
+    sock = _BufferedTLSSocket(packets=6)
+    client = _client_reading(sock)
+
+    _loop_read(client, sock)
+
+    assert client.loop_read.call_count == 6
+    assert sock.pending() == 0
+
+
+def test_loop_read_stops_on_error() -> None:
+    """A failed read does not spin on data still buffered."""
+    sock = _BufferedTLSSocket(packets=6)
+    client = MagicMock()
+    client.loop_read.return_value = MQTT_ERR_CONN_LOST
+
+    _loop_read(client, sock)
+
+    assert client.loop_read.call_count == 1
+
+
+def test_loop_read_plain_socket_reads_once() -> None:
+    """Plain TCP sockets rely on the selector for the next read."""
+    client = MagicMock()
+    client.loop_read.return_value = MQTT_ERR_SUCCESS
+    with socket.socket() as sock:
+        _loop_read(client, sock)
+
+    assert client.loop_read.call_count == 1
@@ -0,0 +1,92 @@
+"""Tests for the MQTT topic filter trie."""
+from __future__ import annotations
+
+from custom_components.honeywell_galaxy.topic_trie import TopicTrie
+
+
+def _trie(*topic_filters: str) -> TopicTrie:
+    """Return a trie holding an empty callback dict for each filter."""
+    trie = TopicTrie()
+    for topic_filter in topic_filters:
+        trie.insert(topic_filter, {})
+    return trie
+
+
+def _matches(trie: TopicTrie, topic: str) -> set[str]:
+    """Return the filters that match a topic."""
+    return {topic_filter for topic_filter, _ in trie.iter_matches(topic.split("/"))}
+
+
+def test_single_level_wildcard() -> None:
+    """+ matches exactly one level."""
+    trie = _trie("a/+/c", "a/+")
+
+    assert _matches(trie, "a/b/c") == {"a/+/c"}
+    assert _matches(trie, "a/b") == {"a/+"}
+    assert _matches(trie, "a/b/d") == set()
+    assert _matches(trie, "a") == set()
+
+
+def test_multi_level_wildcard() -> None:
+    """# matches any number of trailing levels."""
+    trie = _trie("a/#", "#")
+
+    assert _matches(trie, "a/b") == {"a/#", "#"}
+    assert _matches(trie, "a/b/c/d") == {"a/#", "#"}
+    assert _matches(trie, "b/c") == {"#"}
+
+
+def test_multi_level_wildcard_matches_parent() -> None:
+    """a/# also matches a itself."""
+    trie = _trie("a/#", "a/b/#")
+
+    assert _matches(trie, "a") == {"a/#"}
+    assert _matches(trie, "a/b") == {"a/#", "a/b/#"}
+
+
+def test_literal_and_wildcard_filters_both_match() -> None:
+    """Literal and wildcard filters on the same path are all returned."""
+    trie = _trie("a/b", "a/+", "+/b", "a/#")
+
+    assert _matches(trie, "a/b") == {"a/b", "a/+", "+/b", "a/#"}
+
+
+def test_system_topics_skip_leading_wildcards() -> None:
+    """$-prefixed topics are not matched by a leading # or +."""
+    trie = _trie("#", "+/x", "$SYS/#", "$SYS/+")
+
+    assert _matches(trie, "$SYS/x") == {"$SYS/#", "$SYS/+"}
+    assert _matches(trie, "other/x") == {"#", "+/x"}
+
+
+def test_empty_levels() -> None:
+    """Empty topic levels are matched like any other level."""
+    trie = _trie("a/+", "+/b", "a/")
+
+    assert _matches(trie, "a/") == {"a/+", "a/"}
+    assert _matches(trie, "/b") == {"+/b"}
+    assert _matches(trie, "a//b") == set()
+
+
+def test_remove_prunes_to_empty_trie() -> None:
+    """Removing every filter leaves no branches behind."""
+    trie = _trie("a/+/c", "a/#", "+/b")
+    assert trie
+
+    trie.remove("a/+/c")
+    assert _matches(trie, "a/b/c") == {"a/#"}
+    trie.remove("a/#")
+    trie.remove("+/b")
+
+    assert not trie
+    assert _matches(trie, "a/b") == set()
+
+
+def test_remove_keeps_shared_prefix() -> None:
+    """Removing a filter keeps nodes still used by another filter."""
+    trie = _trie("a/b", "a/b/c")
+
+    trie.remove("a/b")
+
+    assert _matches(trie, "a/b") == set()
+    assert _matches(trie, "a/b/c") == {"a/b/c"}